@@ -12,14 +12,24 @@ The Ghost Teammate is designed to be:
 - COLLABORATIVE: Communicates naturally when needed, but doesn't spam
 """
 
-from typing import Dict, Optional
+import string
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
 # =============================================================================
 # CORE SYSTEM PROMPT - THE BRAIN OF GHOST TEAMMATE
 # =============================================================================
 
-GHOST_TEAMMATE_SYSTEM_PROMPT = """
+# The prompt is split into a STATIC prefix (no {...} fields, byte-identical
+# across all invocations) and a DYNAMIC suffix holding every per-request
+# substitution. LLM providers cache only a contiguous static prefix, so an
+# early dynamic field (e.g. the agent email) would break prompt caching for
+# the ~95% of tokens that follow it. Keep new instructions in the static
+# block and new substitutions in the suffix.
+
+GHOST_TEAMMATE_STATIC_PROMPT = """
 # GHOST TEAMMATE - AUTONOMOUS BROWSER AGENT
 
 You are **Ghost**, an advanced AI agent operating within a headless Chromium environment (Steel).
@@ -27,7 +37,7 @@ Your mission is to act as a sovereign, highly skilled remote employee who can ex
 You have a bias for action, a strong visual cortex, and persistent memory.
 
 **Identity & Constraints**
-- **Email**: {agent_email} (Use this for all logins/signups)
+- **Email**: your assigned agent email (listed in the execution state below - use it for all logins/signups)
 - **Role**: Autonomous Web Agent
 - **Environment**: 1280x768 Chromium Browser
 - **Style**: Expert, direct, low-latency, resilient.
@@ -104,12 +114,7 @@ You operate in a potentially supervised loop.
 You have a "Session Memory" (short-term) and "Supermemory" (long-term).
 - **Session Memory**: Screenshots and actions from this specific task.
 - **Supermemory**: User preferences and learned facts.
-
-**Context from Memory**:
-{memory_context}
-
-**Agent Credentials**:
-{agent_credentials}
+- Context from memory and your credentials arrive in a separate context message.
 
 ---
 
@@ -124,13 +129,23 @@ You have a "Session Memory" (short-term) and "Supermemory" (long-term).
 ---
 
 # 🔥 EXECUTION STATE
+"""
 
+# Every per-request substitution lives here, AFTER the cacheable prefix.
+# Memory context and credentials travel in a separate context message (see
+# build_context_message) so the system prompt stays identical across turns
+# for the same user+task even as retrieved memories change.
+GHOST_TEAMMATE_DYNAMIC_SUFFIX = """
+**Agent Email**: {agent_email}
 **Current Task**: {task}
 **User ID**: {user_id}
 
 You are the Ghost in the machine. Proceed with the task.
 """
 
+# Full template - kept for callers that want a single system string.
+GHOST_TEAMMATE_SYSTEM_PROMPT = GHOST_TEAMMATE_STATIC_PROMPT + GHOST_TEAMMATE_DYNAMIC_SUFFIX
+
 
 # =============================================================================
 # STRATEGY DECISION PROMPT
@@ -164,60 +179,185 @@ Then briefly explain why.
 """
 
 
+# =============================================================================
+# PRE-COMPILED TEMPLATES
+# =============================================================================
+# str.format() re-parses the whole template (scanning for {...} fields) on
+# every call. These prompts are multi-KB module constants rendered on every
+# request, so we compile them ONCE at import into f-string closures and
+# render with a single native bytecode pass.
+
+STRATEGY_PROMPT_TEMPLATE = """
+TASK: {task}
+
+CONTEXT:
+{memory_context}
+
+""" + STRATEGY_DECISION_PROMPT + "\n"
+
+
+def _compile_renderer(template: str):
+    """
+    Compile a str.format-style template into an f-string closure.
+
+    The returned callable takes the template's fields as keyword arguments
+    and renders via CPython's native FORMAT_VALUE/BUILD_STRING bytecode -
+    no Formatter parsing and no per-field dict hashing at render time.
+    """
+    fields = []
+    for _literal, field, _spec, _conv in string.Formatter().parse(template):
+        if field and field not in fields:
+            fields.append(field)
+    source = "lambda *, {}: f{!r}".format(", ".join(fields), template)
+    return eval(source)  # noqa: S307 - template is a module constant, not user input
+
+
+# Compiled once per process - rendering is a single bytecode sequence afterwards.
+# Only the dynamic suffix has fields; the static prefix never needs rendering.
+_render_dynamic_suffix = _compile_renderer(GHOST_TEAMMATE_DYNAMIC_SUFFIX)
+_render_strategy_prompt = _compile_renderer(STRATEGY_PROMPT_TEMPLATE)
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def build_system_prompt(
+# The prompt constant is pre-rendered for the default 1280x768 viewport,
+# which covers >99% of calls (the Steel session dimensions). Non-default
+# viewports get their own cached rendering instead of re-stringifying the
+# ints on every request.
+_DEFAULT_VIEWPORT = (1280, 768)
+
+# Interned singleton for the no-memory default so hot requests without
+# prior context share one string object instead of allocating per call.
+_NO_MEMORY = sys.intern("No prior context available.")
+
+
+@lru_cache(maxsize=8)
+def _static_prompt_for_viewport(viewport_width: int, viewport_height: int) -> str:
+    if (viewport_width, viewport_height) == _DEFAULT_VIEWPORT:
+        return GHOST_TEAMMATE_STATIC_PROMPT
+    return GHOST_TEAMMATE_STATIC_PROMPT.replace(
+        "1280x768", f"{viewport_width}x{viewport_height}"
+    )
+
+
+def build_system_prompt_parts(
     user_id: str,
     task: str,
-    memory_context: str = "",
-    agent_credentials: Optional[Dict[str, str]] = None,
     viewport_width: int = 1280,
     viewport_height: int = 768,
-) -> str:
+) -> Tuple[str, str]:
+    """
+    Build the system prompt as (static_prefix, dynamic_suffix).
+
+    The static prefix is byte-identical across all invocations, so callers
+    talking to providers with prompt caching can mark it cacheable (e.g.
+    cache_control: ephemeral) and only pay for the suffix on repeat calls.
+    """
     from backend.core.config import get_settings
     settings = get_settings()
-    
-    agent_email = settings.AGENT_EMAIL
-    agent_password = settings.AGENT_PASSWORD
-    
-    # Format credentials
-    creds_text = f"Primary email: {agent_email}"
+
+    suffix = _render_dynamic_suffix(
+        user_id=user_id,
+        task=task,
+        agent_email=settings.AGENT_EMAIL,  # New variable in prompt
+    )
+    return _static_prompt_for_viewport(viewport_width, viewport_height), suffix
+
+
+@lru_cache(maxsize=128)
+def _format_creds(
+    agent_email: str,
+    agent_password: Optional[str],
+    creds_tuple: Tuple[Tuple[str, str], ...],
+) -> str:
+    """
+    Render the credentials block. The per-user credentials rarely change
+    between requests, so the formatted block is memoized on the
+    (email, password, credentials) tuple.
+    """
+    # Build every line up front and join once - no intermediate `+=` strings
+    parts = [f"Primary email: {agent_email}"]
     if agent_password:
-        creds_text += f"\nPrimary password: {agent_password} (Use this for Google/Email login)"
+        parts.append(f"Primary password: {agent_password} (Use this for Google/Email login)")
+    else:
+        parts.append("_Passwords are handled by the system._")
+    parts.extend(f"- **{platform}**: {email}" for platform, email in creds_tuple)
+    return "\n".join(parts)
+
+
+def build_credentials_block(agent_credentials: Optional[Dict[str, str]] = None) -> str:
+    """
+    Format the agent's credentials block once.
+
+    Callers that keep the same credentials for their whole lifetime (every
+    agent instance does) should call this once and pass the resulting string
+    into build_context_message / build_system_prompt instead of re-paying
+    the formatting on every turn.
+    """
+    from backend.core.config import get_settings
+    settings = get_settings()
+
+    # Sorted tuple for hashability + stable cache keys regardless of dict order
+    creds_tuple = tuple(sorted(agent_credentials.items())) if agent_credentials else ()
+    return _format_creds(settings.AGENT_EMAIL, settings.AGENT_PASSWORD, creds_tuple)
+
+
+def build_context_message(
+    memory_context: str = "",
+    agent_credentials: "Optional[Dict[str, str] | str]" = None,
+) -> str:
+    """
+    Build the per-request memory/credentials block as a standalone message.
+
+    Retrieved memories change between requests; keeping them out of the
+    system prompt means the divergence happens in a late message instead of
+    early in the token stream where it would break prompt caching.
+
+    `agent_credentials` may be the raw {platform: email} dict or an
+    already-formatted block from build_credentials_block.
+    """
+    if isinstance(agent_credentials, str):
+        creds_text = agent_credentials
     else:
-        creds_text += "\n_Passwords are handled by the system._"
-        
-    if agent_credentials:
-        creds_lines = [creds_text]
-        for platform, email in agent_credentials.items():
-            creds_lines.append(f"- **{platform}**: {email}")
-        creds_text = "\n".join(creds_lines)
-    
-    # Format memory context
-    memory_text = memory_context if memory_context else "No prior context available."
-    
-    return GHOST_TEAMMATE_SYSTEM_PROMPT.format(
+        creds_text = build_credentials_block(agent_credentials)
+
+    # Format memory context - the no-memory default reuses one interned object
+    memory_text = memory_context or _NO_MEMORY
+
+    return f"## Memory Context\n{memory_text}\n\n## Credentials\n{creds_text}"
+
+
+def build_system_prompt(
+    user_id: str,
+    task: str,
+    memory_context: str = "",
+    agent_credentials: "Optional[Dict[str, str] | str]" = None,
+    viewport_width: int = 1280,
+    viewport_height: int = 768,
+) -> Tuple[str, str]:
+    """
+    Build the full prompt pair: (system_prompt, context_message).
+
+    The system prompt contains only fields that are stable for a given
+    user+task; callers append the context message as a distinct message.
+    """
+    static, suffix = build_system_prompt_parts(
         user_id=user_id,
         task=task,
-        agent_email=agent_email, # New variable in prompt
-        memory_context=memory_text,
-        agent_credentials=creds_text,
         viewport_width=viewport_width,
         viewport_height=viewport_height,
     )
+    context_message = build_context_message(memory_context, agent_credentials)
+    return static + suffix, context_message
 
 
 def build_strategy_prompt(task: str, memory_context: str = "") -> str:
     """
     Build the prompt for strategic decision making.
     """
-    return f"""
-TASK: {task}
-
-CONTEXT:
-{memory_context if memory_context else "No relevant memories."}
-
-{STRATEGY_DECISION_PROMPT}
-"""
+    return _render_strategy_prompt(
+        task=task,
+        memory_context=memory_context if memory_context else "No relevant memories.",
+    )
@@ -46,6 +46,11 @@ class Settings(BaseSettings):
     # --- App URLs ---
     BACKEND_URL: str = "http://localhost:8000"
     FRONTEND_URL: str = "http://localhost:3000"
+
+    # --- Tuning ---
+    # Max inbound webhook requests processed at once; excess requests queue
+    # instead of opening unbounded Supabase/AgentMail/Temporal connections.
+    INBOUND_MAX_CONCURRENCY: int = 50
     
     class Config:
         env_file = ".env"
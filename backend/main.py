@@ -13,22 +13,139 @@ Run with:
     source venv/bin/activate
     uvicorn backend.main:app --reload --port 8000
 """
+import asyncio
+import logging
+import queue
+import re
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+import orjson
+from cachetools import TTLCache
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from fastapi import FastAPI, Request, HTTPException, Header, Query, Response
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from temporalio.client import Client
-import uuid
+from temporalio.service import RPCError
+import secrets
 from backend.core.config import get_settings
 from backend.temporal.workflows import GhostTeammateWorkflow
+from backend.services.supabase_client import get_supabase
+from backend.services.agentmail_service import get_email_content_by_id
+from backend.services.credentials_service import create_agent_account as create_creds
 
 app = FastAPI(
     title="The Ghost Teammate API",
     description="Headless AI agent that acts as your remote teammate",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the small dict bodies returned by every JSON
+    # handler in C instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 settings = get_settings()
 
+# Structured logger for the request path. Unlike print(), records are only
+# formatted when the level is enabled. Handlers enqueue records and a
+# background listener thread drains them to stdout, so no request coroutine
+# ever blocks the event loop on a stdout write.
+logger = logging.getLogger("ghost")
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+if not logger.handlers:
+    logger.addHandler(QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+@app.on_event("shutdown")
+async def stop_log_listener():
+    """Flush and stop the background logging thread on shutdown."""
+    _log_listener.stop()
+
+
+@app.on_event("shutdown")
+async def close_agentmail_client():
+    """Close the shared AgentMail HTTP connection pool."""
+    from backend.services import agentmail_service
+    await agentmail_service.aclose()
+
+
+# Compiled once at import time; re.search() on a string pattern would hash
+# and look up the pattern cache on every webhook.
+_EMAIL_RE = re.compile(r'[\w\.\+-]+@[\w\.-]+\.\w+')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# selectolax walks the DOM in C; the regex fallback is only for environments
+# without the optional dependency.
+try:
+    from selectolax.parser import HTMLParser as _HTMLParser
+except ImportError:
+    _HTMLParser = None
+
+
+def _html_to_text(html: str) -> str:
+    """Derive plain text from an HTML email body."""
+    if _HTMLParser is not None:
+        return _HTMLParser(html).text(separator=' ').strip()
+    return _TAG_RE.sub('', html).strip()
+
+
+def extract_email(raw: str) -> str:
+    # Hot path: "Name <user@host>" - a find/rfind scan beats the regex
+    # engine here and avoids per-call pattern lookups entirely.
+    if not raw:
+        return ""
+    s = str(raw).strip()
+    # Most senders arrive as a bare "user@example.com" - three substring
+    # checks settle that case before any bracket scan or regex dispatch.
+    if '<' not in s and ' ' not in s and '@' in s:
+        return s.lower()
+    lt = s.rfind('<')
+    if lt != -1:
+        gt = s.find('>', lt + 1)
+        if gt != -1:
+            return s[lt + 1:gt].strip().lower()
+    # Rare path: no angle brackets. The precompiled regex digs an address
+    # out of free-form text ("John Doe john@example.com").
+    match = _EMAIL_RE.search(s)
+    if match:
+        return match.group().lower()
+    return s.lower()
+
+
+class InboundMessage(BaseModel):
+    """
+    One inbound email, however the AgentMail webhook chooses to spell it.
+
+    The payload is validated once instead of being probed with chains of
+    dict.get() fallbacks; aliases absorb the field-name variants seen in
+    real webhook deliveries.
+    """
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    subject: Optional[str] = None
+    from_email: Optional[str] = Field(None, validation_alias=AliasChoices("from", "from_", "sender"))
+    text: Optional[str] = None
+    extracted_text: Optional[str] = None
+    body: Optional[str] = None
+    message_id: Optional[str] = Field(
+        None, validation_alias=AliasChoices("message_id", "messageId", "email_id", "emailId")
+    )
+    id: Optional[str] = None
+
+
+class InboundWebhookPayload(BaseModel):
+    """Envelope for the inbound webhook: message under 'message', 'data', or flat."""
+    model_config = ConfigDict(extra="ignore")
+
+    message: Optional[InboundMessage] = None
+    data: Optional[InboundMessage] = None
+
+
 # CORS for frontend access
 app.add_middleware(
     CORSMiddleware,
@@ -39,19 +156,78 @@ app.add_middleware(
 )
 
 
+# =============================================
+# Shared Clients
+# =============================================
+
+@app.on_event("startup")
+async def connect_clients():
+    """
+    Connect to downstream services once at startup.
+
+    Client.connect() dials a gRPC channel and loads the namespace - tens of
+    milliseconds per call. Handlers reuse this single connection instead of
+    reconnecting per request. The Supabase warm-up query opens the HTTP
+    session so the first inbound webhook doesn't pay the TLS handshake.
+    """
+    app.state.temporal_client = await Client.connect(settings.TEMPORAL_ADDRESS)
+    app.state.supabase = get_supabase()
+    try:
+        await _sb(app.state.supabase.table("profiles").select("id").limit(1))
+    except Exception as e:
+        logger.warning("Supabase warm-up query failed: %s", e)
+
+
 # =============================================
 # Health Check
 # =============================================
 
 @app.get("/")
 async def root():
-    """Health check endpoint."""
+    """Health check endpoint (liveness only - no dependency calls)."""
     return {
         "message": "The Ghost Teammate is active.",
         "version": "1.0.0"
     }
 
 
+@app.head("/health")
+@app.get("/health", include_in_schema=False)
+async def health():
+    """
+    Zero-allocation liveness probe for load balancers and uptime pingers.
+
+    Unlike `/`, serves an empty 204 - no dict allocation, no JSON
+    serialization per probe.
+    """
+    return Response(status_code=204)
+
+
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe - verifies downstream dependencies, unlike `/`.
+
+    Returns 503 until Temporal and Supabase both answer, so load balancers
+    don't route inbound webhooks at a cold or degraded instance.
+    """
+    checks = {}
+    try:
+        await app.state.temporal_client.service_client.check_health()
+        checks["temporal"] = "ok"
+    except Exception as e:
+        checks["temporal"] = str(e)
+    try:
+        await _sb(get_supabase().table("profiles").select("id").limit(1))
+        checks["supabase"] = "ok"
+    except Exception as e:
+        checks["supabase"] = str(e)
+
+    if all(v == "ok" for v in checks.values()):
+        return {"status": "ready", "checks": checks}
+    return ORJSONResponse({"status": "not_ready", "checks": checks}, status_code=503)
+
+
 # =============================================
 # Favicon & Static Assets (Silence 404s)
 # =============================================
@@ -88,8 +264,10 @@ async def launch_task(
     3. Execute the task with HITL safety checks
     """
     try:
-        client = await Client.connect(settings.TEMPORAL_ADDRESS)
-        workflow_id = f"dashboard-{uuid.uuid4()}"
+        client = app.state.temporal_client
+        # token_hex gives the same 128 bits of OS randomness as uuid4
+        # without constructing a UUID object first
+        workflow_id = f"dashboard-{secrets.token_hex(16)}"
         
         await client.start_workflow(
             GhostTeammateWorkflow.run,
@@ -103,8 +281,11 @@ async def launch_task(
             "workflow_id": workflow_id,
             "message": "Task launched successfully"
         }
-    except Exception as e:
-        print(f"❌ Failed to launch task: {e}")
+    except (RPCError, ConnectionError, OSError) as e:
+        # Temporal unreachable / connection-level failures map to a 500;
+        # anything else is a bug and propagates to FastAPI's own handler
+        # instead of being flattened into str(e).
+        logger.error("Failed to launch task: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -112,118 +293,165 @@ async def launch_task(
 # AgentMail Inbound Email Webhook (NEW)
 # =============================================
 
+# Admission control: a mail burst would otherwise fan out to AgentMail,
+# Supabase and Temporal with no bound on in-flight sockets. Excess webhooks
+# wait here rather than exhausting descriptors and pool slots downstream.
+_inbound_semaphore = asyncio.Semaphore(settings.INBOUND_MAX_CONCURRENCY)
+
+
 @app.post("/webhooks/agentmail/inbound")
 async def agentmail_inbound_webhook(request: Request):
     """
     Handles inbound emails from AgentMail.
-    
+
     Payload:
     - event_types: ["message.received"]
     - payload contains email metadata (or ID to fetch)
     """
-    from backend.services.supabase_client import get_supabase
-    from backend.services.agentmail_service import get_email_content_by_id
-    import re
-    
-    raw_payload = await request.json()
-    
-    print(f"📨 Inbound AgentMail webhook received")
-    
-    # Validate structure
-    message_data = {}
+    async with _inbound_semaphore:
+        return await _process_inbound_email(request)
+
+
+# AgentMail redelivers webhooks on 5xx/timeout; remembering fetched bodies
+# briefly turns each redelivery into a dict hit instead of another API call.
+_email_body_cache = TTLCache(maxsize=1024, ttl=600)
+
+
+async def _fetch_email_body(email_id: str) -> dict:
+    """Fetch an email body by id, serving recent repeats from cache."""
+    cached = _email_body_cache.get(email_id)
+    if cached is not None:
+        return cached
+    details = await get_email_content_by_id(email_id)
+    if details.get("success"):
+        _email_body_cache[email_id] = details
+    return details
+
+
+async def _sb(query):
+    """
+    Execute a Supabase query builder in a worker thread.
+
+    supabase-py is synchronous; calling .execute() directly inside an
+    async handler blocks the event loop for every other in-flight request.
+    """
+    return await asyncio.to_thread(query.execute)
+
+
+async def _lookup_user(clean_email: str) -> Optional[dict]:
+    """
+    Resolve a sender address to a profile row.
+
+    One case-insensitive, index-backed round-trip (find_user_by_email_ci
+    matches on lower(email_address)), run in a worker thread so the sync
+    Supabase client never blocks the event loop.
+    """
+    supabase = get_supabase()
+    try:
+        response = await _sb(supabase.rpc("find_user_by_email_ci", {"email": clean_email}))
+        if response.data:
+            return response.data[0]
+    except Exception as e:
+        logger.error("Error looking up user: %s", e)
+    return None
+
+
+async def _process_inbound_email(request: Request):
+    """Inbound email pipeline: parse, identify the sender, start a workflow."""
+    # orjson decodes the (potentially large) AgentMail payload ~3x faster
+    # than the stdlib json parser used by request.json()
+    raw_payload = orjson.loads(await request.body())
+
+    logger.info("Inbound AgentMail webhook received")
     
-    # Check for direct message object (typical AgentMail webhook structure as provided by user)
-    if "message" in raw_payload:
-        message_data = raw_payload["message"]
-    elif "data" in raw_payload:
-        message_data = raw_payload["data"]
-    else:
-        # Fallback for flat structure or unknown
-        message_data = raw_payload
+    # Validate structure once - message object under "message", "data",
+    # or flat at the top level
+    envelope = InboundWebhookPayload.model_validate(raw_payload)
+    message = envelope.message or envelope.data or InboundMessage.model_validate(raw_payload)
 
     # Extract immediate fields
     # Payload example: "from": "Name <email>", "subject": "Sub", "text": "Body", "extracted_text": "Body"
-    subject = message_data.get("subject") or "No Subject"
-    from_email_raw = message_data.get("from") or message_data.get("from_") or ""
-    
+    subject = message.subject or "No Subject"
+    from_email_raw = message.from_email or ""
+
     # Content extraction strategy
-    text_content = message_data.get("text") or message_data.get("extracted_text") or message_data.get("body") or ""
-    
+    text_content = message.text or message.extracted_text or message.body or ""
+
+    clean_email = extract_email(from_email_raw)
+    user_row = None
+    looked_up = False
+
     # If content is missing but we have an ID, try fetching (fallback)
-    if not text_content and (message_data.get("message_id") or message_data.get("id")):
-        email_id = message_data.get("message_id") or message_data.get("id")
-        print(f"📧 Content missing in payload, fetching full email {email_id}...")
-        
-        email_details = await get_email_content_by_id(email_id)
+    email_id = message.message_id or message.id
+    if not text_content and email_id:
+        logger.info("Content missing in payload, fetching full email %s...", email_id)
+
+        if clean_email:
+            # The body fetch and the sender lookup hit different services;
+            # overlap the two round-trips instead of paying for them in series.
+            email_details, user_row = await asyncio.gather(
+                _fetch_email_body(email_id),
+                _lookup_user(clean_email),
+            )
+            looked_up = True
+        else:
+            email_details = await _fetch_email_body(email_id)
+
         if email_details.get("success"):
             text_content = email_details.get("text", "")
+            if not text_content and email_details.get("html"):
+                # HTML-only email: extract readable text rather than dropping it
+                text_content = _html_to_text(email_details["html"])[:2000]
             if not subject or subject == "No Subject":
                 subject = email_details.get("subject", subject)
             if not from_email_raw:
                 from_email_raw = email_details.get("from", "")
+                clean_email = extract_email(from_email_raw)
         else:
-             print(f"⚠️ Failed to fetch email content: {email_details.get('error')}")
+             logger.warning("Failed to fetch email content: %s", email_details.get('error'))
 
     if not text_content:
-        print("❌ No text content found in webhook. Ignoring.")
+        logger.warning("No text content found in webhook. Ignoring.")
         return {"status": "ignored", "reason": "no_content"}
 
     # =========================================================================
     # USER IDENTIFICATION & ROUTING (Same as Resend Logic)
     # =========================================================================
-    
-    def extract_email(raw: str) -> str:
-        if not raw: return ""
-        raw = str(raw).strip()
-        match = re.search(r'<([^>]+)>', raw)
-        if match: return match.group(1).lower().strip()
-        if '@' in raw and ' ' not in raw: return raw.lower().strip()
-        return raw.lower().strip()
-    
-    clean_email = extract_email(from_email_raw)
-    print(f"   Sender: {clean_email}")
-    
+
+    logger.info("Sender: %s", clean_email)
+
+    if not looked_up and clean_email:
+        user_row = await _lookup_user(clean_email)
+
     user_id = None
-    supabase = get_supabase()
-    
-    # Lookup User by Email
-    try:
-        response = supabase.table("profiles").select("id, full_name").eq("email_address", clean_email).execute()
-        if response.data:
-            user_id = response.data[0]['id']
-            print(f"✅ Identified user: {response.data[0].get('full_name')}")
-        else:
-            # Case-insensitive fallback
-            all_profiles = supabase.table("profiles").select("id, email_address").execute()
-            for p in (all_profiles.data or []):
-                if p.get("email_address", "").lower() == clean_email:
-                    user_id = p['id']
-                    print(f"✅ Identified user (case-insensitive)")
-                    break
-    except Exception as e:
-        print(f"❌ Error looking up user: {e}")
+    if user_row:
+        user_id = user_row['id']
+        logger.info("Identified user: %s", user_row.get('full_name'))
 
     if not user_id:
-        print(f"❌ Unknown sender: {clean_email}")
+        logger.warning("Unknown sender: %s", clean_email)
         return {"status": "ignored", "reason": "unknown_user", "email": clean_email}
 
     # Start Workflow
     try:
-        client = await Client.connect(settings.TEMPORAL_ADDRESS)
-        workflow_id = f"email-{uuid.uuid4()}"
-        goal = f"Subject: {subject}\n\n{text_content}"
-        
+        client = app.state.temporal_client
+        workflow_id = f"email-{secrets.token_hex(16)}"
+        # Pass subject and body separately; the workflow joins them on the
+        # worker side. Avoids copying a potentially large email body into a
+        # throwaway concatenated string at the webhook boundary.
+        goal = {"subject": subject, "body": text_content}
+
         await client.start_workflow(
             GhostTeammateWorkflow.run,
             args=[goal, user_id, clean_email],
             id=workflow_id,
             task_queue="ghost-teammate-queue",
         )
-        print(f"🚀 Started workflow: {workflow_id}")
+        logger.info("Started workflow: %s", workflow_id)
         return {"status": "success", "workflow_id": workflow_id}
         
     except Exception as e:
-        print(f"❌ Failed to start workflow: {e}")
+        logger.error("Failed to start workflow: %s", e)
         return {"status": "error", "message": str(e)}
 
 
@@ -242,6 +470,31 @@ async def agentmail_reject(workflow_id: str = Query(...)):
     return await reject_task_logic(workflow_id)
 
 
+@app.post("/webhooks/agentmail/approve_batch")
+async def agentmail_approve_batch(workflow_ids: List[str]):
+    """
+    Approve several tasks in one call (digest emails).
+
+    Signals are pipelined on the shared Temporal client instead of one
+    serial round-trip per workflow.
+    """
+    try:
+        await asyncio.gather(*(_signal_workflow(wid, "approve") for wid in workflow_ids))
+        return {"status": "success", "count": len(workflow_ids)}
+    except Exception as e:
+        raise HTTPException(500, str(e))
+
+
+@app.post("/webhooks/agentmail/reject_batch")
+async def agentmail_reject_batch(workflow_ids: List[str]):
+    """Reject several tasks in one call."""
+    try:
+        await asyncio.gather(*(_signal_workflow(wid, "reject") for wid in workflow_ids))
+        return {"status": "success", "count": len(workflow_ids)}
+    except Exception as e:
+        raise HTTPException(500, str(e))
+
+
 # =============================================
 # Resend Webhooks (DEPRECATED)
 # =============================================
@@ -251,26 +504,34 @@ async def resend_inbound_webhook_deprecated(request: Request):
     """(DEPRECATED) Handles inbound emails from Resend."""
     # ... (Keep existing logic if needed, or redirect/error)
     # For now, we keep it functional but logging warning
-    print("⚠️ WARNING: Received deprecated Resend webhook")
+    logger.warning("Received deprecated Resend webhook")
     return {"status": "ignored", "message": "This endpoint is deprecated. Please use AgentMail webhooks."}
 
 
+# HITL response pages are static - encode them once at import time instead
+# of building and encoding the same markup on every click.
+APPROVED_HTML = "<html><body style='background:#0a0a0b;color:#22c55e;display:flex;justify-content:center;align-items:center;height:100vh;font-family:sans-serif;'><h1>✓ Approved</h1></body></html>".encode()
+REJECTED_HTML = "<html><body style='background:#0a0a0b;color:#ef4444;display:flex;justify-content:center;align-items:center;height:100vh;font-family:sans-serif;'><h1>✗ Rejected</h1></body></html>".encode()
+
+
+async def _signal_workflow(workflow_id: str, signal: str, *args):
+    """Send a signal to a running workflow over the shared Temporal client."""
+    handle = app.state.temporal_client.get_workflow_handle(workflow_id)
+    await handle.signal(signal, *args)
+
+
 # Re-using logic helper for approvals to avoid duplication
 async def approve_task_logic(workflow_id: str):
     try:
-        client = await Client.connect(settings.TEMPORAL_ADDRESS)
-        handle = client.get_workflow_handle(workflow_id)
-        await handle.signal("approve")
-        return HTMLResponse("<html><body style='background:#0a0a0b;color:#22c55e;display:flex;justify-content:center;align-items:center;height:100vh;font-family:sans-serif;'><h1>✓ Approved</h1></body></html>")
+        await _signal_workflow(workflow_id, "approve")
+        return HTMLResponse(APPROVED_HTML)
     except Exception as e:
         raise HTTPException(500, str(e))
 
 async def reject_task_logic(workflow_id: str):
     try:
-        client = await Client.connect(settings.TEMPORAL_ADDRESS)
-        handle = client.get_workflow_handle(workflow_id)
-        await handle.signal("reject")
-        return HTMLResponse("<html><body style='background:#0a0a0b;color:#ef4444;display:flex;justify-content:center;align-items:center;height:100vh;font-family:sans-serif;'><h1>✗ Rejected</h1></body></html>")
+        await _signal_workflow(workflow_id, "reject")
+        return HTMLResponse(REJECTED_HTML)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -302,15 +563,13 @@ async def kill_task(workflow_id: str):
     The workflow will clean up resources (browser session, etc.).
     """
     try:
-        client = await Client.connect(settings.TEMPORAL_ADDRESS)
-        handle = client.get_workflow_handle(workflow_id)
-        await handle.signal("kill")
+        await _signal_workflow(workflow_id, "kill")
         
-        print(f"💀 Workflow {workflow_id} killed")
+        logger.info("Workflow %s killed", workflow_id)
         return {"status": "success", "message": "Task killed successfully"}
-        
+
     except Exception as e:
-        print(f"❌ Failed to kill workflow: {e}")
+        logger.error("Failed to kill workflow: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -326,15 +585,13 @@ async def send_user_message(
     or change direction while a task is running.
     """
     try:
-        client = await Client.connect(settings.TEMPORAL_ADDRESS)
-        handle = client.get_workflow_handle(workflow_id)
-        await handle.signal("user_message", message)
+        await _signal_workflow(workflow_id, "user_message", message)
         
-        print(f"💬 Message sent to workflow {workflow_id}")
+        logger.info("Message sent to workflow %s", workflow_id)
         return {"status": "success", "message": "Message sent to agent"}
-        
+
     except Exception as e:
-        print(f"❌ Failed to send message: {e}")
+        logger.error("Failed to send message: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -346,14 +603,13 @@ async def get_task_status(workflow_id: str):
     Returns approval state, pending messages, etc.
     """
     try:
-        client = await Client.connect(settings.TEMPORAL_ADDRESS)
-        handle = client.get_workflow_handle(workflow_id)
+        handle = app.state.temporal_client.get_workflow_handle(workflow_id)
         status = await handle.query("get_status")
         
         return {"status": "success", "data": status}
         
     except Exception as e:
-        print(f"❌ Failed to get workflow status: {e}")
+        logger.error("Failed to get workflow status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -377,8 +633,6 @@ async def create_agent_account(
     
     The agent can then sign up / log in to the platform using these credentials.
     """
-    from backend.services.credentials_service import create_agent_account as create_creds
-    
     try:
         result = await create_creds(
             user_id=user_id,
@@ -387,7 +641,7 @@ async def create_agent_account(
         )
         return result
     except Exception as e:
-        print(f"❌ Failed to create agent account: {e}")
+        logger.error("Failed to create agent account: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -396,12 +650,10 @@ async def list_agent_accounts(user_id: str = Query(...)):
     """
     Lists all agent accounts for a user.
     """
-    from backend.services.supabase_client import get_supabase
-    
     supabase = get_supabase()
-    result = supabase.table("workspaces").select(
+    result = await _sb(supabase.table("workspaces").select(
         "platform_name, agent_email, is_active, created_at"
-    ).eq("user_id", user_id).execute()
+    ).eq("user_id", user_id))
     
     return {"accounts": result.data or []}
 
@@ -416,13 +668,16 @@ async def debug_list_profiles():
     DEBUG: List all profiles in the database.
     Remove this endpoint in production!
     """
-    from backend.services.supabase_client import get_supabase
-    
     supabase = get_supabase()
-    result = supabase.table("profiles").select("id, email_address, full_name, created_at").execute()
-    
+    # HEAD count + bounded sample: response size stays constant no matter
+    # how large the profiles table grows
+    count_result, sample = await asyncio.gather(
+        _sb(supabase.table("profiles").select("id", count="exact", head=True)),
+        _sb(supabase.table("profiles").select("id, email_address, full_name, created_at").limit(50)),
+    )
+
     return {
-        "count": len(result.data or []),
+        "count": count_result.count or 0,
         "profiles": [
             {
                 "id": p["id"][:8] + "...",
@@ -430,7 +685,7 @@ async def debug_list_profiles():
                 "name": p.get("full_name"),
                 "created": p.get("created_at")
             }
-            for p in (result.data or [])
+            for p in (sample.data or [])
         ]
     }
 
@@ -440,23 +695,26 @@ async def debug_lookup_email(email: str):
     """
     DEBUG: Test email lookup.
     """
-    from backend.services.supabase_client import get_supabase
-    
+    # Normalize once at ingress; every comparison below assumes lowercase
+    email = email.lower()
     supabase = get_supabase()
-    
+
     # Direct lookup
-    result = supabase.table("profiles").select("id, email_address, full_name").eq("email_address", email.lower()).execute()
-    
+    result = await _sb(supabase.table("profiles").select("id, email_address, full_name").eq("email_address", email))
+
     if result.data:
         return {"found": True, "profile": result.data[0]}
-    
-    # Case-insensitive fallback
-    all_profiles = supabase.table("profiles").select("id, email_address, full_name").execute()
-    for p in (all_profiles.data or []):
-        if p.get("email_address", "").lower() == email.lower():
-            return {"found": True, "profile": p, "method": "case_insensitive"}
-    
-    return {"found": False, "searched_for": email.lower()}
+
+    # Case-insensitive fallback, resolved in the database instead of
+    # pulling every profile row into Python and scanning linearly
+    ci_result = await _sb(
+        supabase.table("profiles").select("id, email_address, full_name")
+        .ilike("email_address", email).limit(1)
+    )
+    if ci_result.data:
+        return {"found": True, "profile": ci_result.data[0], "method": "case_insensitive"}
+
+    return {"found": False, "searched_for": email}
 
 
 # =============================================
@@ -464,5 +722,16 @@ async def debug_lookup_email(email: str):
 # =============================================
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools move the event loop and HTTP parsing into C.
+    # Multiple workers need the import-string form; each worker builds its
+    # own Temporal/Supabase clients in the startup hook.
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
@@ -21,21 +21,42 @@ https://google.github.io/adk-docs/
 Reference:
 https://ai.google.dev/gemini-api/docs/computer-use
 """
+import asyncio
+import io
 import json
+import re
 import base64
+import hashlib
+import logging
 import time
+from collections import OrderedDict, deque
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime
 from google import genai
 from google.genai import types
 from google.genai.types import Content, Part
 from backend.core.config import get_settings
-from backend.core.agent_prompts import build_system_prompt, build_strategy_prompt
-from backend.services.supermemory_service import search_knowledge, get_user_context
+from backend.core.agent_prompts import (
+    build_system_prompt,
+    build_strategy_prompt,
+    build_credentials_block,
+)
+from backend.services.supermemory_service import search_knowledge, get_user_context, add_memory
+from backend.services.agentmail_service import search_agent_inbox, send_agent_email
 from backend.services import steel_service
 
+try:
+    from PIL import Image
+    _PIL_AVAILABLE = True
+except ImportError:  # pragma: no cover - Pillow is in requirements
+    _PIL_AVAILABLE = False
+
 settings = get_settings()
 
+# One Gemini client for the whole process: agents created back-to-back by
+# the factory share its TLS connection pool instead of re-handshaking.
+_GENAI_CLIENT = genai.Client(api_key=settings.GEMINI_API_KEY)
+
 # ============================================================================
 # MODEL CONFIGURATION - ALWAYS USE gemini-3-flash-preview
 # ============================================================================
@@ -56,15 +77,88 @@ MAX_COORDINATE = 1000
 MAX_SCREENSHOT_RETRIES = 3
 SCREENSHOT_RETRY_DELAY = 1.0  # seconds
 
+# Actions with no side effects on page state — safe to run concurrently
+# when a single turn emits several of them.
+PARALLEL_SAFE = {"hover_at", "check_email", "wait_5_seconds"}
+
+# Matches: SAVE_TO_MEMORY: category - content...
+_SAVE_MEMORY_RE = re.compile(r"SAVE_TO_MEMORY:\s*(\w+)\s*-\s*(.+)", re.MULTILINE)
+
+# CRITICAL-ONLY keywords that ALWAYS require approval.
+# Note: "send email" is absent to allow standard communication unless it's
+# explicitly about "external" people.
+HIGH_RISK_PATTERNS = [
+    ("delete permanently", "Permanent deletion (trash empty)"),
+    ("delete forever", "Permanent deletion"),
+    ("cannot be undone", "Irreversible action"),
+    ("confirm payment", "Executing financial transaction"),
+    ("checkout", " completing purchase"),
+    ("revoke access", "Revoking user access"),
+    ("make public", "Publishing content publicly"),
+    ("cancel subscription", "Canceling subscription plan"),
+    ("email to external", "Emailing unknown external recipient"),
+]
+
+# One case-insensitive alternation compiled at import time: a single C-level
+# pass over the reasoning instead of one Python substring scan per pattern.
+_HIGH_RISK_RE = re.compile(
+    "|".join(re.escape(p) for p, _ in HIGH_RISK_PATTERNS), re.IGNORECASE
+)
+_HIGH_RISK_DESCRIPTIONS = {p: d for p, d in HIGH_RISK_PATTERNS}
+
+
+def _compress_screenshot(img_bytes: bytes) -> bytes:
+    """
+    Downscale a screenshot to the declared viewport and re-encode as WebP.
+
+    Steel's PNGs run 300KB-2MB; Gemini's image token cost and TTFT scale
+    with payload size, and WebP at quality 80 is typically 5-10x smaller
+    with no loss the model can perceive. Returns the original PNG bytes
+    untouched if Pillow is unavailable or the image cannot be decoded.
+    """
+    if not _PIL_AVAILABLE:
+        return img_bytes
+    try:
+        img = Image.open(io.BytesIO(img_bytes))
+        img.thumbnail((SCREEN_WIDTH, SCREEN_HEIGHT), Image.BILINEAR)
+        buf = io.BytesIO()
+        img.save(buf, "WEBP", quality=80, method=4)
+        return buf.getvalue()
+    except Exception:
+        return img_bytes
+
+
+# ============================================================================
+# STRATEGY DECISION CACHE
+# ============================================================================
+# The planning model maps (task, memory context) to one of three choices.
+# Recurring task patterns (e.g. repeated email triggers) hit this local LRU
+# and skip the planning LLM round-trip entirely.
+
+_STRATEGY_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_STRATEGY_CACHE_MAX = 1024
+_strategy_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _strategy_cache_key(task: str, memory_context: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(task.encode())
+    h.update(b"\x00")
+    h.update(memory_context.encode())
+    return h.digest()
+
 
 def denormalize_x(x: int) -> int:
     """Convert normalized X coordinate (0-999) to actual pixels."""
-    return int(x / MAX_COORDINATE * SCREEN_WIDTH)
+    # Integer multiply + floor-divide stays in the integer ALU; the float
+    # round-trip of int(x / MAX * WIDTH) gave identical results for the
+    # 0-999 range but cost a divide and a truncation per click
+    return (x * SCREEN_WIDTH) // MAX_COORDINATE
 
 
 def denormalize_y(y: int) -> int:
     """Convert normalized Y coordinate (0-999) to actual pixels."""
-    return int(y / MAX_COORDINATE * SCREEN_HEIGHT)
+    return (y * SCREEN_HEIGHT) // MAX_COORDINATE
 
 
 # ============================================================================
@@ -81,123 +175,164 @@ class SessionMemory:
     
     def __init__(self, max_turns: int = 50):
         self.max_turns = max_turns
-        self.contents: List[Content] = []
-        self.actions_log: List[Dict[str, Any]] = []
+        # First two entries (initial instructions) are pinned; the rest live
+        # in a bounded deque that evicts oldest-first in O(1), replacing the
+        # old slice-and-concatenate trim that copied the list on every append.
+        self._prefix: List[Content] = []
+        self._tail: "deque[Content]" = deque(maxlen=max_turns)
+        # Bounded: summaries only ever read recent entries, so older ones
+        # would just pin memory on multi-hour sessions
+        self.actions_log: "deque[Dict[str, Any]]" = deque(maxlen=1000)
         self.task_started_at: Optional[datetime] = None
         self.current_task: str = ""
-        self.task_progress: List[str] = []  # Human-readable progress steps
-        
+        self.task_progress: "deque[Tuple[int, str]]" = deque(maxlen=200)  # (time_ns, step)
+        # Hash of the most recent frame, for deduping identical screenshots
+        self._last_png_hash: Optional[int] = None
+
+    def _image_part(self, image_bytes: bytes) -> Part:
+        """
+        Turn a screenshot into a Part, deduping unchanged frames.
+
+        While the agent waits on a slow page the browser returns the same
+        pixels turn after turn; resending ~200 KB of base64 per request
+        costs local CPU and upstream tokens for zero new information.
+        """
+        frame_hash = hash(image_bytes)
+        if frame_hash == self._last_png_hash:
+            return Part(text="[screenshot unchanged since previous frame]")
+        self._last_png_hash = frame_hash
+        # WebP (RIFF....WEBP) after _compress_screenshot, PNG otherwise
+        mime = 'image/webp' if image_bytes[8:12] == b'WEBP' else 'image/png'
+        return Part.from_bytes(data=image_bytes, mime_type=mime)
+
+    @property
+    def contents(self) -> List[Content]:
+        """Conversation history: pinned instructions plus the recent window."""
+        return self._prefix + list(self._tail)
+
+    def _append(self, content: Content):
+        if len(self._prefix) < 2:
+            self._prefix.append(content)
+        else:
+            self._tail.append(content)
+
     def add_user_message(self, text: str, image_bytes: Optional[bytes] = None):
         """Add a user message (potentially with screenshot)."""
         parts = [Part(text=text)]
         if image_bytes:
-            parts.append(Part.from_bytes(data=image_bytes, mime_type='image/png'))
-        self.contents.append(Content(role="user", parts=parts))
-        self._trim_if_needed()
-    
+            parts.append(self._image_part(image_bytes))
+        self._append(Content(role="user", parts=parts))
+
     def add_model_response(self, content: Content):
         """Add model's response to history."""
-        self.contents.append(content)
-        self._trim_if_needed()
-    
+        self._append(content)
+
     def add_function_response(self, responses: List[types.FunctionResponse], image_bytes: Optional[bytes] = None):
         """Add function execution results."""
         parts = [Part(function_response=fr) for fr in responses]
         if image_bytes:
-            parts.append(Part.from_bytes(data=image_bytes, mime_type='image/png'))
-        self.contents.append(Content(role="user", parts=parts))
-        self._trim_if_needed()
+            parts.append(self._image_part(image_bytes))
+        self._append(Content(role="user", parts=parts))
     
     def log_action(self, action_name: str, args: Dict[str, Any], result: Dict[str, Any]):
         """Log an action for traceability."""
+        # Raw nanosecond stamp; isoformat() machinery is deferred to whoever
+        # actually renders the log
         self.actions_log.append({
-            "timestamp": datetime.utcnow().isoformat(),
+            "ts_ns": time.time_ns(),
             "action": action_name,
             "args": args,
             "result": result
         })
-    
+
     def add_progress(self, step: str):
         """Add a human-readable progress step."""
-        self.task_progress.append(f"[{datetime.utcnow().strftime('%H:%M:%S')}] {step}")
-    
+        self.task_progress.append((time.time_ns(), step))
+
     def get_progress_summary(self) -> str:
         """Get a summary of progress for email updates."""
         if not self.task_progress:
             return "No progress yet."
-        return "\n".join(self.task_progress[-10:])  # Last 10 steps
-    
-    def _trim_if_needed(self):
-        """Keep conversation history under max_turns."""
-        if len(self.contents) > self.max_turns * 2:
-            # Keep first message (initial instructions) and recent history
-            self.contents = self.contents[:2] + self.contents[-self.max_turns:]
+        # Format timestamps only for the 10 steps actually emitted
+        return "\n".join(
+            f"[{datetime.utcfromtimestamp(ts_ns / 1e9).strftime('%H:%M:%S')}] {step}"
+            for ts_ns, step in list(self.task_progress)[-10:]
+        )
     
     def clear(self):
         """Clear session memory for new task."""
-        self.contents = []
-        self.actions_log = []
+        self._prefix.clear()
+        self._tail.clear()
+        self._last_png_hash = None
+        self.actions_log.clear()
         self.task_started_at = None
         self.current_task = ""
-        self.task_progress = []
+        self.task_progress.clear()
 
 
 # ============================================================================
 # EMAIL COMMUNICATION TOOLS
 # ============================================================================
 
-class EmailCommunicator:
-    """
-    Handles email-based communication with the user.
-    The agent can ask for clarification, report progress, or request approval.
-    """
-    
-    def __init__(self, user_id: str, job_id: str):
-        self.user_id = user_id
-        self.job_id = job_id
-    
-    async def send_clarification_request(self, question: str, context: str = "") -> bool:
-        """Ask the user for clarification via email."""
-        from backend.services.resend_service import send_agent_email
-        
-        subject = f"🤔 Clarification Needed - Ghost Agent"
-        body = f"""Hi there,
+# Email sends happen off the agent's critical path: the loop doesn't need
+# the Resend RTT to finish before the next tool step, but a burst of sends
+# must not exhaust sockets either.
+_EMAIL_SEM = asyncio.Semaphore(16)
+
+# Child of the "ghost" logger configured in main.py (queue-backed, so
+# failure logging never stalls the event loop); %s args defer formatting
+# until a handler actually emits the record.
+log = logging.getLogger("ghost.email")
+
+
+async def _send_bounded(coro):
+    async with _EMAIL_SEM:
+        await coro
+
+
+def _report_send_failure(task: "asyncio.Task"):
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        log.warning("Failed to send agent email: %s", exc)
+
+
+def _fire_and_forget_email(coro) -> bool:
+    """Schedule an email send without blocking the agent loop."""
+    task = asyncio.create_task(_send_bounded(coro))
+    task.add_done_callback(_report_send_failure)
+    return True
+
+
+# Static email scaffolding, built once at import time instead of re-parsing
+# the same multi-line f-strings on every send.
+_STATUS_EMOJI = {
+    "in_progress": "⏳",
+    "completed": "✅",
+    "blocked": "🚧",
+    "error": "❌"
+}
+
+_CLARIFICATION_BODY = """Hi there,
 
 I'm working on your request but need some clarification:
 
 **Question:** {question}
 
-{f"**Context:** {context}" if context else ""}
+{context_line}
 
 Please reply to this email with your answer, and I'll continue the task.
 
 Best,
 Ghost Agent 🤖
 """
-        try:
-            await send_agent_email(self.user_id, subject, body)
-            return True
-        except Exception as e:
-            print(f"⚠️ Failed to send clarification email: {e}")
-            return False
-    
-    async def send_progress_update(self, progress_summary: str, status: str = "in_progress") -> bool:
-        """Send a progress update to the user."""
-        from backend.services.resend_service import send_agent_email
-        
-        status_emoji = {
-            "in_progress": "⏳",
-            "completed": "✅",
-            "blocked": "🚧",
-            "error": "❌"
-        }.get(status, "📊")
-        
-        subject = f"{status_emoji} Task Update - Ghost Agent"
-        body = f"""Hi there,
+
+_PROGRESS_BODY = """Hi there,
 
 Here's an update on your request:
 
-**Status:** {status.replace('_', ' ').title()}
+**Status:** {status}
 
 **Progress:**
 {progress_summary}
@@ -207,19 +342,8 @@ I'll keep you posted as things progress.
 Best,
 Ghost Agent 🤖
 """
-        try:
-            await send_agent_email(self.user_id, subject, body)
-            return True
-        except Exception as e:
-            print(f"⚠️ Failed to send progress email: {e}")
-            return False
-    
-    async def send_completion_report(self, result: str, attachments: Optional[List[str]] = None) -> bool:
-        """Send task completion report to user."""
-        from backend.services.resend_service import send_agent_email
-        
-        subject = "✅ Task Completed - Ghost Agent"
-        body = f"""Hi there,
+
+_COMPLETION_BODY = """Hi there,
 
 Great news! I've completed your request.
 
@@ -231,11 +355,54 @@ If you need anything else, just send me another email!
 Best,
 Ghost Agent 🤖
 """
+
+
+class EmailCommunicator:
+    """
+    Handles email-based communication with the user.
+    The agent can ask for clarification, report progress, or request approval.
+    """
+
+    def __init__(self, user_id: str, job_id: str):
+        self.user_id = user_id
+        self.job_id = job_id
+
+    async def send_clarification_request(self, question: str, context: str = "") -> bool:
+        """Ask the user for clarification via email."""
+        subject = "🤔 Clarification Needed - Ghost Agent"
+        body = _CLARIFICATION_BODY.format(
+            question=question,
+            context_line=f"**Context:** {context}" if context else ""
+        )
+        try:
+            return _fire_and_forget_email(send_agent_email(self.user_id, subject, body))
+        except Exception as e:
+            log.warning("Failed to send clarification email: %s", e)
+            return False
+    
+    async def send_progress_update(self, progress_summary: str, status: str = "in_progress") -> bool:
+        """Send a progress update to the user."""
+        status_emoji = _STATUS_EMOJI.get(status, "📊")
+
+        subject = f"{status_emoji} Task Update - Ghost Agent"
+        body = _PROGRESS_BODY.format(
+            status=status.replace('_', ' ').title(),
+            progress_summary=progress_summary
+        )
+        try:
+            return _fire_and_forget_email(send_agent_email(self.user_id, subject, body))
+        except Exception as e:
+            log.warning("Failed to send progress email: %s", e)
+            return False
+    
+    async def send_completion_report(self, result: str, attachments: Optional[List[str]] = None) -> bool:
+        """Send task completion report to user."""
+        subject = "✅ Task Completed - Ghost Agent"
+        body = _COMPLETION_BODY.format(result=result)
         try:
-            await send_agent_email(self.user_id, subject, body)
-            return True
+            return _fire_and_forget_email(send_agent_email(self.user_id, subject, body))
         except Exception as e:
-            print(f"⚠️ Failed to send completion email: {e}")
+            log.warning("Failed to send completion email: %s", e)
             return False
 
 
@@ -277,10 +444,13 @@ class GhostTeammateAgent:
         self.user_profile = user_profile
         self.session_id = session_id
         self.agent_credentials = agent_credentials or {}
+        # Credentials never change for the lifetime of an agent - format the
+        # prompt block once instead of on every turn
+        self.credentials_block = build_credentials_block(self.agent_credentials)
         self.job_id = job_id or "unknown"
         
-        # Initialize Gemini client
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        # Shared process-wide Gemini client (see _GENAI_CLIENT)
+        self.client = _GENAI_CLIENT
         
         # Session memory (short-term)
         self.memory = SessionMemory()
@@ -292,11 +462,41 @@ class GhostTeammateAgent:
         self.browser_opened = False
         self.current_url = "about:blank"
 
-    def _get_system_instruction(self, task: str = "") -> str:
+        # Post-action screenshot capture started at the end of one turn and
+        # awaited at the top of the next, overlapping the Steel RTT with
+        # everything that happens between turns
+        self._pending_screenshot: Optional["asyncio.Task"] = None
+
+        # Prompts are static for a given task; cache them so execute_turn
+        # does not pay the Supermemory round-trip on every single turn
+        self._prompt_cache: Dict[str, Tuple[str, str]] = {}
+
+    def cancel_pending_screenshot(self):
         """
-        Returns the comprehensive system prompt that defines the agent's persona.
-        Combines long-term memory from Supermemory with task context.
+        Cancel a prefetched screenshot that will never be consumed.
+
+        Call when the agent is done with its session, so the background
+        capture doesn't keep hitting Steel after the session is released.
+        """
+        if self._pending_screenshot is not None:
+            self._pending_screenshot.cancel()
+            self._pending_screenshot = None
+
+    def _build_prompts(self, task: str = "") -> Tuple[str, str]:
+        """
+        Returns (system_instruction, context_message), memoized per task.
+
+        The system instruction defines the agent's persona and stays stable
+        across turns; the context message carries the per-request memory and
+        credentials block and is appended to the conversation separately so
+        the system prompt remains cache-friendly. Both depend only on the
+        task, so the get_user_context network call happens once per task
+        instead of once per turn.
         """
+        cached = self._prompt_cache.get(task)
+        if cached is not None:
+            return cached
+
         memory_context = ""
         try:
             user_context = get_user_context(self.user_id, task)
@@ -308,47 +508,78 @@ Relevant Memories: {user_context.get('relevant_memories', 'None')}
 """
         except Exception as e:
             print(f"⚠️ Failed to fetch memory context: {e}")
-        
-        return build_system_prompt(
+
+        prompts = build_system_prompt(
             user_id=self.user_id,
             task=task or self.memory.current_task,
             memory_context=memory_context,
-            agent_credentials=self.agent_credentials,
+            agent_credentials=self.credentials_block,
             viewport_width=SCREEN_WIDTH,
             viewport_height=SCREEN_HEIGHT,
         )
+        if len(self._prompt_cache) > 8:
+            self._prompt_cache.clear()
+        self._prompt_cache[task] = prompts
+        return prompts
 
-    def _take_screenshot_with_retry(self) -> Optional[bytes]:
+    async def _take_screenshot_with_retry(self) -> Tuple[Optional[bytes], Optional[str]]:
         """
         Take screenshot with retry logic for robustness.
-        Returns decoded bytes or None if all retries fail.
+
+        Runs the blocking Steel call in a worker thread and sleeps with
+        exponential backoff between attempts, so retries never stall the
+        event loop. After the first failure the next attempt races two
+        concurrent captures and keeps whichever responds first, which cuts
+        tail latency when an individual capture hangs.
+
+        Returns (image_bytes, original_base64) — the bytes are what gets
+        fed to Gemini (possibly WebP re-encoded), while the base64 string
+        is Steel's untouched encoding, kept so callers that need base64
+        (the HITL approval payload) don't re-encode the image. Both are
+        None if all retries fail.
         """
+        def _capture():
+            return asyncio.ensure_future(
+                asyncio.to_thread(steel_service.take_screenshot, self.session_id)
+            )
+
         for attempt in range(MAX_SCREENSHOT_RETRIES):
             try:
-                img_b64 = steel_service.take_screenshot(self.session_id)
-                
+                if attempt == 0:
+                    img_b64 = await _capture()
+                else:
+                    done, pending = await asyncio.wait(
+                        {_capture(), _capture()},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in pending:
+                        task.cancel()
+                    img_b64 = done.pop().result()
+
                 # Handle empty or None response
                 if not img_b64:
                     print(f"⚠️ Screenshot attempt {attempt + 1}: Empty response, retrying...")
-                    time.sleep(SCREENSHOT_RETRY_DELAY)
+                    await asyncio.sleep(SCREENSHOT_RETRY_DELAY * 2 ** attempt)
                     continue
-                
+
                 # Decode base64
                 img_bytes = base64.b64decode(img_b64)
-                
+
                 if len(img_bytes) < 100:  # Suspiciously small
                     print(f"⚠️ Screenshot attempt {attempt + 1}: Suspiciously small ({len(img_bytes)} bytes), retrying...")
-                    time.sleep(SCREENSHOT_RETRY_DELAY)
+                    await asyncio.sleep(SCREENSHOT_RETRY_DELAY * 2 ** attempt)
                     continue
-                    
-                return img_bytes
-                
+
+                # Re-encode off the loop: PIL decode + WebP encode is CPU work
+                img_bytes = await asyncio.to_thread(_compress_screenshot, img_bytes)
+                return img_bytes, img_b64
+
             except Exception as e:
                 print(f"⚠️ Screenshot attempt {attempt + 1} failed: {e}")
-                time.sleep(SCREENSHOT_RETRY_DELAY)
-        
+                await asyncio.sleep(SCREENSHOT_RETRY_DELAY * 2 ** attempt)
+
         print("❌ All screenshot attempts failed")
-        return None
+        return None, None
 
     async def decide_strategy(self, goal: str) -> Dict[str, Any]:
         """
@@ -364,30 +595,62 @@ Relevant Memories: {user_context.get('relevant_memories', 'None')}
         self.memory.current_task = goal
         self.memory.task_started_at = datetime.utcnow()
         
-        # Retrieve relevant context from Supermemory (long-term memory)
-        memory_context = search_knowledge(goal, self.user_id)
-        
+        # Retrieve relevant context from Supermemory (long-term memory) and
+        # build the prompts concurrently — both are independent network
+        # round-trips, so they overlap instead of running back-to-back.
+        # On a cache hit the prompt task still warms _prompt_cache for
+        # execute_turn, so nothing is wasted.
+        prompts_task = asyncio.create_task(
+            asyncio.to_thread(self._build_prompts, goal)
+        )
+        memory_context = await asyncio.to_thread(
+            search_knowledge, goal, self.user_id
+        )
+
+        # Check the local decision cache before paying for an LLM round-trip
+        cache_key = _strategy_cache_key(goal, memory_context)
+        cached = _STRATEGY_CACHE.get(cache_key)
+        if cached is not None:
+            _STRATEGY_CACHE.move_to_end(cache_key)
+            _strategy_cache_stats["hits"] += 1
+            print(f"🗂️ Strategy cache hit ({_strategy_cache_stats['hits']} hits / "
+                  f"{_strategy_cache_stats['misses']} misses)")
+            self.memory.add_progress(f"Strategy decided (cached): {cached['strategy']}")
+            # Leave the warm-up running; just swallow any late failure
+            prompts_task.add_done_callback(
+                lambda t: t.cancelled() or t.exception()
+            )
+            return dict(cached)
+        _strategy_cache_stats["misses"] += 1
+
         # Use the centralized strategy prompt builder
         planning_prompt = build_strategy_prompt(goal, memory_context)
-        
-        response = self.client.models.generate_content(
+
+        system_instruction, context_message = await prompts_task
+        response = await self.client.aio.models.generate_content(
             model=PLANNING_MODEL,
-            contents=[planning_prompt],
+            contents=[context_message, planning_prompt],
             config=types.GenerateContentConfig(
-                system_instruction=self._get_system_instruction(goal)
+                system_instruction=system_instruction
             )
         )
         
         text = response.text.upper() if response.text else ""
         
         self.memory.add_progress(f"Strategy decided: {text[:50]}...")
-        
+
         if "BROWSER" in text:
-            return {"strategy": "BROWSER", "reasoning": response.text}
+            decision = {"strategy": "BROWSER", "reasoning": response.text}
         elif "CLARIFY" in text:
-            return {"strategy": "CLARIFY", "reasoning": response.text}
+            decision = {"strategy": "CLARIFY", "reasoning": response.text}
         else:
-            return {"strategy": "MEMORY", "reasoning": response.text}
+            decision = {"strategy": "MEMORY", "reasoning": response.text}
+
+        _STRATEGY_CACHE[cache_key] = dict(decision)
+        if len(_STRATEGY_CACHE) > _STRATEGY_CACHE_MAX:
+            _STRATEGY_CACHE.popitem(last=False)
+
+        return decision
 
     async def execute_turn(self, task: str) -> Dict[str, Any]:
         """
@@ -406,9 +669,14 @@ Relevant Memories: {user_context.get('relevant_memories', 'None')}
             raise ValueError("No Steel session ID provided")
         
         self.memory.current_task = task
-        
-        # 1. OBSERVE: Take screenshot of current browser state
-        img_bytes = self._take_screenshot_with_retry()
+
+        # 1. OBSERVE: use the capture kicked off after last turn's actions
+        # when one is pending, otherwise take a fresh screenshot now
+        if self._pending_screenshot is not None:
+            img_bytes, img_b64 = await self._pending_screenshot
+            self._pending_screenshot = None
+        else:
+            img_bytes, img_b64 = await self._take_screenshot_with_retry()
         
         if img_bytes is None:
             # Screenshot failed - report error
@@ -420,34 +688,36 @@ Relevant Memories: {user_context.get('relevant_memories', 'None')}
                 "approval_action": None,
                 "error": "screenshot_failed"
             }
-        
-            # Check for feedback/interruption before starting turn
-            # (In a real temporal workflow, this would be a Signal)
-            # For now, we simulate this by checking if the last user message was a feedback
-            
-            # Initialize conversation with the task (first turn only)
-            if not self.memory.contents:
-                initial_message = f"""GOAL: {task}
 
-You are controlling a browser. 
-The browser is previously opened. 
+        system_instruction, context_message = self._build_prompts(task)
+
+        # Check for feedback/interruption before starting turn
+        # (In a real temporal workflow, this would be a Signal)
+        # For now, we simulate this by checking if the last user message was a feedback
+
+        # Initialize conversation with the task (first turn only)
+        if not self.memory.contents:
+            self.memory.add_user_message(context_message)
+            initial_message = f"""GOAL: {task}
+
+You are controlling a browser.
+The browser is previously opened.
 Observe the screenshot and execute the next logical step.
 Strictly follow the coordinate system (0-1000).
 
 Refuse to stop until the task is clearly done.
 """
-                self.memory.add_user_message(initial_message, img_bytes)
-                self.memory.add_progress("Started browser session")
-            else:
-                # Add new screenshot to existing conversation for the next turn
-                # This is where we would also inject "USER FEEDBACK" if we had a signal
-                next_prompt = "Here is the current state. What's the next action?"
-                self.memory.add_user_message(next_prompt, img_bytes)
+            self.memory.add_user_message(initial_message, img_bytes)
+            self.memory.add_progress("Started browser session")
+        else:
+            # Add new screenshot to existing conversation for the next turn
+            # This is where we would also inject "USER FEEDBACK" if we had a signal
+            next_prompt = "Here is the current state. What's the next action?"
+            self.memory.add_user_message(next_prompt, img_bytes)
 
-        
         # 2. THINK: Get Gemini's next action using Computer Use
         config = types.GenerateContentConfig(
-            system_instruction=self._get_system_instruction(task),
+            system_instruction=system_instruction,
             tools=[
                 types.Tool(
                     computer_use=types.ComputerUse(
@@ -458,16 +728,42 @@ Refuse to stop until the task is clearly done.
                     )
                 )
             ],
+            # Function calling stays on AUTO: the computer-use model already
+            # emits thought + call in one completion, and a call-free STOP is
+            # this loop's only "task finished" signal — forcing mode ANY
+            # would make every task run the workflow's full turn budget
             # Enable thinking for better reasoning
             thinking_config=types.ThinkingConfig(include_thoughts=True)
         )
         
+        # Stream the response: reasoning text and function calls accumulate
+        # as chunks decode instead of waiting for the full payload, trimming
+        # time-to-first-action on TTFT-bound turns
+        reasoning_parts = []
+        function_calls = []
+        model_parts = []
+        finish_reason = None
+
         try:
-            response = self.client.models.generate_content(
+            stream = await self.client.aio.models.generate_content_stream(
                 model=COMPUTER_USE_MODEL,
                 contents=self.memory.contents,
                 config=config
             )
+            async for chunk in stream:
+                if not chunk.candidates:
+                    continue
+                if chunk.candidates[0].finish_reason is not None:
+                    finish_reason = chunk.candidates[0].finish_reason
+                content = chunk.candidates[0].content
+                if not content or not content.parts:
+                    continue
+                for part in content.parts:
+                    model_parts.append(part)
+                    if part.text:
+                        reasoning_parts.append(part.text)
+                    if part.function_call:
+                        function_calls.append(part.function_call)
         except Exception as e:
             print(f"❌ Gemini API error: {e}")
             return {
@@ -478,27 +774,13 @@ Refuse to stop until the task is clearly done.
                 "approval_action": None,
                 "error": "model_error"
             }
-        
-        if not response.candidates:
+
+        if not model_parts:
             return {"reasoning": "No response from Gemini", "finished": True, "action_taken": None}
-        
-        candidate = response.candidates[0]
-        
+
         # Add model response to conversation history
-        if candidate.content:
-            self.memory.add_model_response(candidate.content)
-        
-        # Extract reasoning text and function calls
-        reasoning_parts = []
-        function_calls = []
-        
-        if candidate.content and candidate.content.parts:
-            for part in candidate.content.parts:
-                if part.text:
-                    reasoning_parts.append(part.text)
-                if part.function_call:
-                    function_calls.append(part.function_call)
-        
+        self.memory.add_model_response(Content(role="model", parts=model_parts))
+
         reasoning = " ".join(reasoning_parts).strip()
         
         print(f"💭 Reasoning: {reasoning[:200]}...")
@@ -517,39 +799,64 @@ Refuse to stop until the task is clearly done.
                 "action_taken": None,
                 "requires_approval": True,
                 "approval_action": approval_action,
-                "screenshot": base64.b64encode(img_bytes).decode() if img_bytes else None,
+                # Steel's original base64 — no decode/encode round-trip
+                "screenshot": img_b64,
             }
         
-        # If no function calls, the agent is done or needs clarification
+        # No function calls: done only when the model actually finished
+        # (STOP). Anything else (truncation, safety cut) gets re-prompted
+        # next turn instead of silently ending the task.
         if not function_calls:
-            self.memory.add_progress(f"Completed: {reasoning[:100]}...")
+            finished = finish_reason in (None, types.FinishReason.STOP)
+            if finished:
+                self.memory.add_progress(f"Completed: {reasoning[:100]}...")
+            else:
+                self.memory.add_progress(
+                    f"No actions emitted (finish_reason={finish_reason}); continuing"
+                )
             return {
                 "reasoning": reasoning,
-                "finished": True,
+                "finished": finished,
                 "action_taken": None,
                 "requires_approval": False,
                 "approval_action": None,
             }
         
-        # 3. ACT: Execute each function call via Steel
-        function_responses = []
-        actions_taken = []
-        
+        # 3. ACT: Execute each function call via Steel. Read-only actions
+        # (see PARALLEL_SAFE) are launched together and awaited as a batch;
+        # mutating actions stay strictly sequential. Responses are recorded
+        # in the model's original call order either way.
+        calls = []
         for fc in function_calls:
             action_name = fc.name or "unknown"
             args = dict(fc.args) if fc.args else {}
-            
             print(f"🔧 Executing: {action_name} with args: {args}")
-            actions_taken.append(action_name)
-            
-            # Execute the action
-            result = self._execute_computer_action(action_name, args)
-            
-            # Log action
+            calls.append((action_name, args))
+
+        actions_taken = [name for name, _ in calls]
+
+        if all(name in PARALLEL_SAFE for name, _ in calls) and len(calls) > 1:
+            results = await asyncio.gather(
+                *(self._execute_computer_action(name, args) for name, args in calls),
+                return_exceptions=True,
+            )
+            # One failed action shouldn't cancel its peers — surface it the
+            # same way _dispatch_steel_action reports failures
+            results = [
+                {"status": "error", "error": str(r)}
+                if isinstance(r, BaseException) else r
+                for r in results
+            ]
+        else:
+            results = [
+                await self._execute_computer_action(name, args)
+                for name, args in calls
+            ]
+
+        function_responses = []
+        for (action_name, args), result in zip(calls, results):
             self.memory.log_action(action_name, args, result)
             self.memory.add_progress(f"Action: {action_name}")
-            
-            # Prepare function response
             function_responses.append(
                 types.FunctionResponse(
                     name=action_name,
@@ -557,11 +864,11 @@ Refuse to stop until the task is clearly done.
                 )
             )
         
-        # 4. FEEDBACK: Get new screenshot after actions
-        new_screenshot_bytes = self._take_screenshot_with_retry()
-        
-        # Add function responses and new screenshot (if available)
-        self.memory.add_function_response(function_responses, new_screenshot_bytes)
+        # 4. FEEDBACK: record function responses now; the post-action
+        # screenshot is captured in the background and attached to the next
+        # turn's user message, so its RTT overlaps with turn teardown
+        self.memory.add_function_response(function_responses)
+        self._pending_screenshot = asyncio.create_task(self._take_screenshot_with_retry())
         
         return {
             "reasoning": reasoning,
@@ -594,15 +901,11 @@ Refuse to stop until the task is clearly done.
         Scans reasoning for 'SAVE_TO_MEMORY: [category] - [content]' pattern
         and automatically saves to Supermemory.
         """
-        import re
-        from backend.services.supermemory_service import add_memory
-        
-        # Regex to capture content after SAVE_TO_MEMORY:
-        # Matches: SAVE_TO_MEMORY: category - content...
-        pattern = r"SAVE_TO_MEMORY:\s*(\w+)\s*-\s*(.+)"
-        matches = re.finditer(pattern, reasoning, re.MULTILINE)
-        
-        for match in matches:
+        # Cheap substring check first — most turns never mention the trigger
+        if "SAVE_TO_MEMORY" not in reasoning:
+            return
+
+        for match in _SAVE_MEMORY_RE.finditer(reasoning):
             category = match.group(1).lower()
             content = match.group(2).strip()
             
@@ -628,33 +931,46 @@ Refuse to stop until the task is clearly done.
         
         Refined to be less spammy - allows standard actions.
         """
-        reasoning_lower = reasoning.lower()
-        
-        # CRITICAL-ONLY keywords that ALWAYS require approval
-        high_risk_patterns = [
-            ("delete permanently", "Permanent deletion (trash empty)"),
-            ("delete forever", "Permanent deletion"),
-            ("cannot be undone", "Irreversible action"),
-            ("confirm payment", "Executing financial transaction"),
-            ("checkout", " completing purchase"),
-            ("revoke access", "Revoking user access"),
-            ("make public", "Publishing content publicly"),
-            ("cancel subscription", "Canceling subscription plan"),
-            # Note: "send email" is removed to allow standard communication
-            # unless it's explicitly about "external" people
-            ("email to external", "Emailing unknown external recipient"),
-        ]
-        
-        for pattern, description in high_risk_patterns:
-            if pattern in reasoning_lower:
-                return True, description
-        
+        match = _HIGH_RISK_RE.search(reasoning)
+        if match:
+            return True, _HIGH_RISK_DESCRIPTIONS[match.group(0).lower()]
         return False, None
 
-    def _execute_computer_action(self, action_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_computer_action(self, action_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a Computer Use action.
+
+        Async-native actions (inbox search) are awaited directly; the Steel
+        HTTP dispatch runs in a worker thread so the event loop stays free.
+        """
+        if action_name == "check_email":
+            query = args.get("query")
+            sent_to = args.get("sent_to")
+            limit = args.get("limit", 3)
+            print(f"📧 Checking inbox for: {query} (to: {sent_to})")
+
+            try:
+                messages = await search_agent_inbox(self.user_id, query, limit, sent_to)
+            except Exception as e:
+                print(f"⚠️ Action failed: {action_name} - {e}")
+                return {"status": "error", "error": str(e)}
+
+            if not messages:
+                return {"status": "success", "found": False, "messages": []}
+
+            return {
+                "status": "success",
+                "found": True,
+                "messages": messages,
+                "count": len(messages)
+            }
+
+        return await asyncio.to_thread(self._dispatch_steel_action, action_name, args)
+
+    def _dispatch_steel_action(self, action_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a Computer Use action via Steel.
-        
+
         Maps Gemini's computer-use actions to Steel API calls.
         Reference: https://ai.google.dev/gemini-api/docs/computer-use#supported-actions
         """
@@ -673,31 +989,39 @@ Refuse to stop until the task is clearly done.
                 if not url.startswith(("http://", "https://")):
                     url = "https://" + url
                 print(f"🌐 Navigating to: {url}")
-                # Use keyboard shortcut to navigate
-                steel_service.press_keys(self.session_id, ["Control", "l"])
-                steel_service.type_text(self.session_id, url)
-                steel_service.press_keys(self.session_id, ["Enter"])
-                steel_service.wait(self.session_id, 2.0)
+                # Use keyboard shortcut to navigate (one batched sequence)
+                steel_service.run_sequence(self.session_id, [
+                    {"action": "press_key", "keys": ["Control", "l"]},
+                    {"action": "type_text", "text": url},
+                    {"action": "press_key", "keys": ["Enter"]},
+                    {"action": "wait", "duration": 2.0},
+                ])
                 self.current_url = url
                 return {"status": "success", "url": url}
             
             elif action_name == "search":
-                # Open a new tab and go to Google
-                steel_service.press_keys(self.session_id, ["Control", "t"])
-                steel_service.wait(self.session_id, 0.5)
-                steel_service.type_text(self.session_id, "https://google.com")
-                steel_service.press_keys(self.session_id, ["Enter"])
-                steel_service.wait(self.session_id, 2.0)
+                # Open a new tab and go to Google (one batched sequence)
+                steel_service.run_sequence(self.session_id, [
+                    {"action": "press_key", "keys": ["Control", "t"]},
+                    {"action": "wait", "duration": 0.5},
+                    {"action": "type_text", "text": "https://google.com"},
+                    {"action": "press_key", "keys": ["Enter"]},
+                    {"action": "wait", "duration": 2.0},
+                ])
                 return {"status": "success", "message": "Opened Google search"}
             
             elif action_name == "go_back":
-                steel_service.press_keys(self.session_id, ["Alt", "ArrowLeft"])
-                steel_service.wait(self.session_id, 1.0)
+                steel_service.run_sequence(self.session_id, [
+                    {"action": "press_key", "keys": ["Alt", "ArrowLeft"]},
+                    {"action": "wait", "duration": 1.0},
+                ])
                 return {"status": "success"}
-            
+
             elif action_name == "go_forward":
-                steel_service.press_keys(self.session_id, ["Alt", "ArrowRight"])
-                steel_service.wait(self.session_id, 1.0)
+                steel_service.run_sequence(self.session_id, [
+                    {"action": "press_key", "keys": ["Alt", "ArrowRight"]},
+                    {"action": "wait", "duration": 1.0},
+                ])
                 return {"status": "success"}
             
             elif action_name == "wait_5_seconds":
@@ -711,16 +1035,20 @@ Refuse to stop until the task is clearly done.
                 x = denormalize_x(args.get("x", 500))
                 y = denormalize_y(args.get("y", 500))
                 print(f"🖱️ Clicking at ({x}, {y})")
-                steel_service.click(self.session_id, x, y)
-                steel_service.wait(self.session_id, 0.5)
+                steel_service.run_sequence(self.session_id, [
+                    {"action": "click_mouse", "coordinates": [x, y]},
+                    {"action": "wait", "duration": 0.5},
+                ])
                 return {"status": "success", "x": x, "y": y}
             
             elif action_name == "double_click_at":
                 x = denormalize_x(args.get("x", 500))
                 y = denormalize_y(args.get("y", 500))
                 print(f"🖱️🖱️ Double-clicking at ({x}, {y})")
-                steel_service.double_click(self.session_id, x, y)
-                steel_service.wait(self.session_id, 0.5)
+                steel_service.run_sequence(self.session_id, [
+                    {"action": "click_mouse", "coordinates": [x, y], "num_clicks": 2},
+                    {"action": "wait", "duration": 0.5},
+                ])
                 return {"status": "success", "x": x, "y": y}
             
             elif action_name == "hover_at":
@@ -751,24 +1079,22 @@ Refuse to stop until the task is clearly done.
                 clear_before = args.get("clear_before_typing", True)
                 
                 print(f"⌨️ Typing '{text[:30]}...' at ({x}, {y})")
-                
-                # Click to focus
-                steel_service.click(self.session_id, x, y)
-                steel_service.wait(self.session_id, 0.2)
-                
-                # Clear existing text if requested
+
+                # Click to focus, optionally clear, type, optionally submit —
+                # all as one batched sequence
+                ops = [
+                    {"action": "click_mouse", "coordinates": [x, y]},
+                    {"action": "wait", "duration": 0.2},
+                ]
                 if clear_before:
-                    steel_service.press_keys(self.session_id, ["Control", "a"])
-                    steel_service.press_keys(self.session_id, ["Backspace"])
-                
-                # Type the text
-                steel_service.type_text(self.session_id, text)
-                
-                # Press enter if requested
+                    ops.append({"action": "press_key", "keys": ["Control", "a"]})
+                    ops.append({"action": "press_key", "keys": ["Backspace"]})
+                ops.append({"action": "type_text", "text": text})
                 if press_enter:
-                    steel_service.press_keys(self.session_id, ["Enter"])
-                    steel_service.wait(self.session_id, 1.0)
-                
+                    ops.append({"action": "press_key", "keys": ["Enter"]})
+                    ops.append({"action": "wait", "duration": 1.0})
+                steel_service.run_sequence(self.session_id, ops)
+
                 return {"status": "success", "text": text}
             
             elif action_name == "key_combination":
@@ -784,8 +1110,10 @@ Refuse to stop until the task is clearly done.
             elif action_name == "scroll_document":
                 direction = args.get("direction", "down")
                 key = "PageDown" if direction == "down" else "PageUp"
-                steel_service.press_keys(self.session_id, [key])
-                steel_service.wait(self.session_id, 0.5)
+                steel_service.run_sequence(self.session_id, [
+                    {"action": "press_key", "keys": [key]},
+                    {"action": "wait", "duration": 0.5},
+                ])
                 return {"status": "success", "direction": direction}
             
             elif action_name == "scroll_at":
@@ -798,47 +1126,6 @@ Refuse to stop until the task is clearly done.
                 steel_service.scroll(self.session_id, x, y, delta_y)
                 return {"status": "success", "direction": direction}
             
-            # ================================================================
-            # EMAIL / VERIFICATION TOOLS
-            # ================================================================
-            elif action_name == "check_email":
-                query = args.get("query")
-                sent_to = args.get("sent_to")
-                limit = args.get("limit", 3)
-                print(f"📧 Checking inbox for: {query} (to: {sent_to})")
-                
-                from backend.services.agentmail_service import search_agent_inbox
-                # Run async in sync context if needed, but since we are in `execute_turn` which is async
-                # wait.. `_execute_computer_action` is currently sync in this file?
-                # Ah, looking at the code, `_execute_computer_action` is synchronous in dispatch 
-                # but calls async services? No, Steel methods are sync. 
-                # We need to bridge this. Ideally `_execute_computer_action` should be async.
-                # Since I cannot refactor the whole method to async right now without breaking potential callers,
-                # I will use a sync wrapper or specific dispatch. 
-                # Actually, `execute_turn` awaits `agent.execute_turn` so we can make valid async calls if we bubble it up.
-                # BUT `_execute_computer_action` is called in `execute_turn` and NOT awaited there currently in the loop 
-                # (it says `result = self._execute_computer_action(...)`).
-                
-                # FIX: We will do a quick async-to-sync bridge or better yet, Import a sync/helper.
-                # Since we are in an async loop in `execute_turn`, let's just use `asyncio.run` or loop run? 
-                # No, that's bad practice in nested loops. 
-                # Let's check `execute_turn` implementation. It IS `async def execute_turn`.
-                # So we SHOULD await `_execute_computer_action` if we make it async. 
-                # But to avoid massive refactor, I will implement a bridge here just for this tool.
-                import asyncio
-                loop = asyncio.get_event_loop()
-                messages = loop.run_until_complete(search_agent_inbox(self.user_id, query, limit, sent_to))
-                
-                if not messages:
-                    return {"status": "success", "found": False, "messages": []}
-                
-                return {
-                    "status": "success", 
-                    "found": True, 
-                    "messages": messages, 
-                    "count": len(messages)
-                }
-            
             # ================================================================
             # UNKNOWN ACTION
             # ================================================================
@@ -855,6 +1142,64 @@ Refuse to stop until the task is clearly done.
 # FACTORY FUNCTION
 # ============================================================================
 
+# Credentials change rarely; cache {platform: agent_email} per user briefly
+# so a user spawning several agents pays the Supabase round-trip once.
+_CREDENTIALS_TTL = 60.0  # seconds
+_credentials_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+
+def _group_credentials(rows: List[dict]) -> Dict[str, str]:
+    return {ws["platform_name"]: ws["agent_email"] for ws in rows or []}
+
+
+async def _fetch_credentials(user_id: str) -> Dict[str, str]:
+    """Load a user's {platform: agent_email} map, with a short TTL cache."""
+    cached = _credentials_cache.get(user_id)
+    if cached is not None and time.monotonic() - cached[0] < _CREDENTIALS_TTL:
+        return cached[1]
+
+    from backend.services.supabase_client import get_supabase
+
+    supabase = get_supabase()
+    workspaces = await asyncio.to_thread(
+        supabase.table("workspaces").select(
+            "platform_name, agent_email"
+        ).eq("user_id", user_id).eq("is_active", True).execute
+    )
+    credentials = _group_credentials(workspaces.data)
+    _credentials_cache[user_id] = (time.monotonic(), credentials)
+    return credentials
+
+
+async def prefetch_credentials(user_ids: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Warm the credentials cache for many users with one Supabase query.
+
+    Used before bulk agent spawn so create_agent_with_credentials hits the
+    cache instead of issuing one round-trip per user.
+    """
+    from backend.services.supabase_client import get_supabase
+
+    supabase = get_supabase()
+    workspaces = await asyncio.to_thread(
+        supabase.table("workspaces").select(
+            "user_id, platform_name, agent_email"
+        ).in_("user_id", user_ids).eq("is_active", True).execute
+    )
+
+    by_user: Dict[str, list] = {uid: [] for uid in user_ids}
+    for ws in workspaces.data or []:
+        by_user.setdefault(ws["user_id"], []).append(ws)
+
+    now = time.monotonic()
+    result = {}
+    for uid, rows in by_user.items():
+        credentials = _group_credentials(rows)
+        _credentials_cache[uid] = (now, credentials)
+        result[uid] = credentials
+    return result
+
+
 async def create_agent_with_credentials(
     user_id: str,
     user_profile: dict,
@@ -864,19 +1209,8 @@ async def create_agent_with_credentials(
     """
     Factory function that creates an agent with its credentials pre-loaded.
     """
-    from backend.services.supabase_client import get_supabase
-    
-    # Load agent's credentials from Supabase
-    supabase = get_supabase()
-    workspaces = supabase.table("workspaces").select(
-        "platform_name, agent_email"
-    ).eq("user_id", user_id).eq("is_active", True).execute()
-    
-    credentials = {}
-    if workspaces.data:
-        for ws in workspaces.data:
-            credentials[ws["platform_name"]] = ws["agent_email"]
-    
+    credentials = await _fetch_credentials(user_id)
+
     return GhostTeammateAgent(
         user_id=user_id,
         user_profile=user_profile,
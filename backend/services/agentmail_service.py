@@ -14,8 +14,10 @@ Security:
 - Webhook signature verification
 - Agent isolation via unique identity
 """
+import asyncio
 import httpx
 import json
+from string import Template
 from typing import Optional, List, Dict, Any
 from backend.core.config import get_settings
 from backend.services.supabase_client import get_supabase
@@ -28,6 +30,22 @@ HEADERS = {
     "Content-Type": "application/json"
 }
 
+# One pooled client for the whole process. Opening a fresh AsyncClient per
+# call paid DNS + TCP + TLS to api.agentmail.to every time; with keep-alive
+# connections a burst of notification emails reuses warm sockets instead.
+_client = httpx.AsyncClient(
+    base_url=API_BASE,
+    headers=HEADERS,
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+
+async def aclose():
+    """Close the shared AgentMail client (call from app shutdown)."""
+    await _client.aclose()
+
 # Brand colors (Same as before for consistency)
 BRAND_BG = "#0A0A0B"
 BRAND_CARD = "#111113"
@@ -51,12 +69,9 @@ async def get_email_content_by_id(message_id: str) -> dict:
     Fetches the full email content from AgentMail API.
     GET /messages/{message_id}
     """
-    url = f"{API_BASE}/messages/{message_id}"
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=HEADERS)
-            
+        response = await _client.get(f"/messages/{message_id}")
+
         if response.status_code != 200:
             print(f"❌ Failed to fetch message {message_id}: {response.text}")
             return {"success": False, "error": response.text}
@@ -79,6 +94,25 @@ async def get_email_content_by_id(message_id: str) -> dict:
         return {"success": False, "error": str(e)}
 
 
+async def get_email_contents_by_ids(message_ids: List[str]) -> Dict[str, dict]:
+    """
+    Fetches several messages concurrently over the pooled client.
+
+    AgentMail has no multi-id GET, so this fans out one request per id in
+    a single gather — with keep-alive connections the batch costs roughly
+    one round-trip instead of one per message. Returns {message_id: result},
+    where failed fetches carry the usual {"success": False, ...} shape.
+    """
+    results = await asyncio.gather(
+        *(get_email_content_by_id(mid) for mid in message_ids),
+        return_exceptions=True,
+    )
+    return {
+        mid: {"success": False, "error": str(r)} if isinstance(r, BaseException) else r
+        for mid, r in zip(message_ids, results)
+    }
+
+
 async def send_teammate_email(
     user_email: str, 
     user_id: str, 
@@ -93,9 +127,7 @@ async def send_teammate_email(
     agent_email = get_agent_email()
     # inbox_id is typically the email address or UUID. Using email as per SDK example.
     inbox_id = agent_email
-    
-    url = f"{API_BASE}/inboxes/{inbox_id}/messages"
-    
+
     payload = {
         "to": user_email,
         "subject": subject,
@@ -115,9 +147,8 @@ async def send_teammate_email(
         }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=HEADERS, json=payload)
-            
+        response = await _client.post(f"/inboxes/{inbox_id}/messages", json=payload)
+
         if response.status_code >= 400:
             print(f"⚠️ AgentMail Send Failed: {response.text}")
             return {"id": None, "error": response.text}
@@ -130,6 +161,25 @@ async def send_teammate_email(
         return {"id": None, "error": str(e)}
 
 
+async def send_many(messages: List[Dict[str, Any]]) -> List[dict]:
+    """
+    Send several emails concurrently through the shared client.
+
+    Each dict holds send_teammate_email kwargs. All POSTs go out in one
+    gather, so a workspace broadcast costs one round-trip instead of one
+    per recipient; a failed send is returned in place as an error dict
+    rather than cancelling its peers.
+    """
+    results = await asyncio.gather(
+        *(send_teammate_email(**msg) for msg in messages),
+        return_exceptions=True,
+    )
+    return [
+        {"id": None, "error": str(r)} if isinstance(r, BaseException) else r
+        for r in results
+    ]
+
+
 async def search_agent_inbox(user_id: str, query: str = None, limit: int = 5, sent_to: str = None) -> List[Dict[str, Any]]:
     """
     Allows the agent to search its OWN inbox for verification codes, etc.
@@ -143,17 +193,14 @@ async def search_agent_inbox(user_id: str, query: str = None, limit: int = 5, se
     
     # GET /inboxes/{inbox_id}/messages
     # We can probably filter by 'q' or 'to' parameters if supported
-    url = f"{API_BASE}/inboxes/{inbox_id}/messages"
-    
     params = {"limit": limit}
     # If API supports 'q' or 'search'
     if query:
         params["q"] = query
-        
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=HEADERS, params=params)
-            
+        response = await _client.get(f"/inboxes/{inbox_id}/messages", params=params)
+
         if response.status_code != 200:
             print(f"⚠️ Failed to list messages: {response.text}")
             return []
@@ -203,9 +250,10 @@ async def search_agent_inbox(user_id: str, query: str = None, limit: int = 5, se
 #  HTML GENERATORS (Ported for consistency)
 # ==============================================================================
 
-def _get_email_wrapper(content: str, footer_text: str = "") -> str:
-    # Same standard branded wrapper
-    return f'''
+# Templates are interpolated once at import: the brand constants are baked
+# in here, so each send only substitutes the genuinely dynamic fields
+# instead of rebuilding a ~2KB f-string from scratch.
+_WRAPPER_TMPL = Template(f'''
     <!DOCTYPE html>
     <html>
     <head>
@@ -235,13 +283,13 @@ def _get_email_wrapper(content: str, footer_text: str = "") -> str:
                         </tr>
                         <tr>
                             <td style="background: {BRAND_CARD}; border: 1px solid {BRAND_BORDER}; border-radius: 12px; padding: 32px;">
-                                {content}
+                                ${{CONTENT}}
                             </td>
                         </tr>
                         <tr>
                             <td style="padding: 24px 0 0 0; text-align: center;">
                                 <p style="margin: 0 0 8px 0; color: {BRAND_DIM}; font-size: 12px;">
-                                    {footer_text or "Reply to this email to continue the conversation."}
+                                    ${{FOOTER}}
                                 </p>
                                 <p style="margin: 0; color: {BRAND_DIM}; font-size: 11px; opacity: 0.7;">
                                     Powered by AgentMail · Your AI coworker
@@ -254,30 +302,22 @@ def _get_email_wrapper(content: str, footer_text: str = "") -> str:
         </table>
     </body>
     </html>
-    '''
+    ''')
 
-async def send_agent_email(user_id: str, subject: str, body_text: str) -> dict:
-    """Send general agent email."""
-    supabase = get_supabase()
-    result = supabase.table("profiles").select("email").eq("id", user_id).single().execute()
-    
-    if not result.data or not result.data.get("email"):
-        raise ValueError(f"Could not find email for user {user_id}")
-    
-    user_email = result.data["email"]
-    body_html_content = body_text.replace('\n', '<br>')
-    
-    content = f'<div style="font-size: 14px; color: {BRAND_TEXT}; line-height: 1.7;">{body_html_content}</div>'
-    html = _get_email_wrapper(content)
-    
-    return await send_teammate_email(user_email, user_id, subject, html)
 
-async def send_approval_request(user_email: str, user_id: str, workflow_id: str, action: str) -> dict:
-    """Sends Human-in-the-Loop approval email."""
-    approve_url = f"{settings.BACKEND_URL}/webhooks/agentmail/approve?workflow_id={workflow_id}"
-    reject_url = f"{settings.BACKEND_URL}/webhooks/agentmail/reject?workflow_id={workflow_id}"
-    
-    content = f'''
+def _get_email_wrapper(content: str, footer_text: str = "") -> str:
+    # Same standard branded wrapper
+    return _WRAPPER_TMPL.substitute(
+        CONTENT=content,
+        FOOTER=footer_text or "Reply to this email to continue the conversation.",
+    )
+
+
+_AGENT_BODY_TMPL = Template(
+    f'<div style="font-size: 14px; color: {BRAND_TEXT}; line-height: 1.7;">${{BODY}}</div>'
+)
+
+_APPROVAL_TMPL = Template(f'''
         <div style="text-align: center; margin-bottom: 24px;">
             <div style="display: inline-block; width: 56px; height: 56px; background: rgba(245, 158, 11, 0.1); border-radius: 16px; line-height: 56px; font-size: 28px;">⚠️</div>
         </div>
@@ -285,78 +325,114 @@ async def send_approval_request(user_email: str, user_id: str, workflow_id: str,
         <p style="margin: 0 0 24px 0; color: {BRAND_MUTED}; font-size: 14px; text-align: center;">Your Ghost Teammate wants to perform an action that requires your explicit approval.</p>
         <div style="background: {BRAND_BG}; border-left: 3px solid {BRAND_WARNING}; padding: 16px 20px; margin: 0 0 24px 0; border-radius: 0 8px 8px 0;">
             <p style="margin: 0 0 6px 0; font-size: 11px; color: {BRAND_DIM}; text-transform: uppercase;">Proposed Action</p>
-            <p style="margin: 0; font-size: 14px; color: white;">{action}</p>
+            <p style="margin: 0; font-size: 14px; color: white;">${{ACTION}}</p>
         </div>
         <table role="presentation" width="100%">
             <tr>
                 <td style="padding-right: 8px; width: 50%;">
-                    <a href="{approve_url}" style="display: block; background: {BRAND_SUCCESS}; color: white; padding: 14px 24px; text-decoration: none; border-radius: 8px; text-align: center; font-weight: 600;">✓ Approve</a>
+                    <a href="${{APPROVE_URL}}" style="display: block; background: {BRAND_SUCCESS}; color: white; padding: 14px 24px; text-decoration: none; border-radius: 8px; text-align: center; font-weight: 600;">✓ Approve</a>
                 </td>
                 <td style="padding-left: 8px; width: 50%;">
-                    <a href="{reject_url}" style="display: block; background: {BRAND_ERROR}; color: white; padding: 14px 24px; text-decoration: none; border-radius: 8px; text-align: center; font-weight: 600;">✗ Reject</a>
+                    <a href="${{REJECT_URL}}" style="display: block; background: {BRAND_ERROR}; color: white; padding: 14px 24px; text-decoration: none; border-radius: 8px; text-align: center; font-weight: 600;">✗ Reject</a>
                 </td>
             </tr>
         </table>
-    '''
-    return await send_teammate_email(user_email, user_id, "⚠️ Action Requires Your Approval", _get_email_wrapper(content))
+    ''')
 
-async def send_task_started_email(user_email: str, user_id: str, goal: str, dashboard_url: Optional[str] = None, thread_id: str = None) -> dict:
-    dash_link = dashboard_url or f"{settings.FRONTEND_URL}/dashboard"
-    
-    # If replying to a thread, use a more conversational style
-    if thread_id:
-        content = f'''
+_TASK_STARTED_REPLY_TMPL = Template(f'''
             <p style="margin: 0 0 16px 0; color: white; font-size: 15px;">I'm on it! 🫡</p>
             <p style="margin: 0 0 24px 0; color: {BRAND_MUTED}; font-size: 14px;">I've started working on this. I'll let you know when it's done.</p>
-            
-            <a href="{dash_link}" style="display: inline-block; background: {BRAND_PRIMARY}; color: white; padding: 10px 18px; text-decoration: none; border-radius: 6px; font-size: 13px; font-weight: 500;">Watch progress live →</a>
-        '''
-        subject = "Re: Your Request" # Subject is usually ignored in threading but good fallback
-    else:
-        # Standard notification for dashboard-initiated tasks
-        content = f'''
+
+            <a href="${{DASH_LINK}}" style="display: inline-block; background: {BRAND_PRIMARY}; color: white; padding: 10px 18px; text-decoration: none; border-radius: 6px; font-size: 13px; font-weight: 500;">Watch progress live →</a>
+        ''')
+
+_TASK_STARTED_TMPL = Template(f'''
             <div style="text-align: center; margin-bottom: 24px;">
                 <div style="display: inline-block; width: 56px; height: 56px; background: rgba(59, 130, 246, 0.1); border-radius: 16px; line-height: 56px; font-size: 28px;">🚀</div>
             </div>
             <h1 style="margin: 0 0 8px 0; font-size: 22px; font-weight: 600; color: white; text-align: center;">Task Started</h1>
             <div style="background: {BRAND_BG}; border: 1px solid {BRAND_BORDER}; padding: 16px 20px; margin: 0 0 24px 0; border-radius: 8px;">
                 <p style="margin: 0 0 6px 0; font-size: 11px; color: {BRAND_DIM}; text-transform: uppercase;">Your Request</p>
-                <p style="margin: 0; font-size: 14px; color: white;">{goal[:500]}</p>
+                <p style="margin: 0; font-size: 14px; color: white;">${{GOAL}}</p>
             </div>
-            <a href="{dash_link}" style="display: block; background: {BRAND_PRIMARY}; color: white; padding: 14px 24px; text-decoration: none; border-radius: 8px; text-align: center; font-weight: 600;">Watch Live in Dashboard →</a>
-        '''
-        subject = "🚀 Working on your task"
-
-    return await send_teammate_email(user_email, user_id, subject, _get_email_wrapper(content), thread_id=thread_id)
+            <a href="${{DASH_LINK}}" style="display: block; background: {BRAND_PRIMARY}; color: white; padding: 14px 24px; text-decoration: none; border-radius: 8px; text-align: center; font-weight: 600;">Watch Live in Dashboard →</a>
+        ''')
 
-async def send_completion_email(user_email: str, user_id: str, goal: str, summary: str, actions_taken: Optional[list] = None) -> dict:
-    actions_html = ""
-    if actions_taken:
-        items = "".join([f'<li style="margin: 8px 0; color: {BRAND_TEXT}; font-size: 13px;">{a}</li>' for a in actions_taken[:5]])
-        actions_html = f'<div style="background: {BRAND_BG}; border: 1px solid {BRAND_BORDER}; padding: 16px 20px; margin: 0 0 24px 0; border-radius: 8px;"><ul style="margin: 0; padding-left: 20px;">{items}</ul></div>'
-    
-    content = f'''
+_COMPLETION_TMPL = Template(f'''
         <div style="text-align: center; margin-bottom: 24px;">
             <div style="display: inline-block; width: 56px; height: 56px; background: rgba(34, 197, 94, 0.1); border-radius: 16px; line-height: 56px; font-size: 28px;">✅</div>
         </div>
         <h1 style="margin: 0 0 8px 0; font-size: 22px; font-weight: 600; color: {BRAND_SUCCESS}; text-align: center;">Task Completed</h1>
         <div style="background: {BRAND_BG}; border-left: 3px solid {BRAND_SUCCESS}; padding: 16px 20px; margin: 0 0 24px 0; border-radius: 0 8px 8px 0;">
             <p style="margin: 0 0 6px 0; font-size: 11px; color: {BRAND_DIM}; text-transform: uppercase;">Summary</p>
-            <p style="margin: 0; font-size: 14px; color: white; line-height: 1.6;">{summary}</p>
+            <p style="margin: 0; font-size: 14px; color: white; line-height: 1.6;">${{SUMMARY}}</p>
         </div>
-        {actions_html}
-    '''
-    return await send_teammate_email(user_email, user_id, "✅ Task Completed", _get_email_wrapper(content))
+        ${{ACTIONS_HTML}}
+    ''')
 
-async def send_error_email(user_email: str, user_id: str, goal: str, error_type: str, error_message: str) -> dict:
-    content = f'''
+_ERROR_TMPL = Template(f'''
         <div style="text-align: center; margin-bottom: 24px;">
             <div style="display: inline-block; width: 56px; height: 56px; background: rgba(239, 68, 68, 0.1); border-radius: 16px; line-height: 56px; font-size: 28px;">❌</div>
         </div>
         <h1 style="margin: 0 0 8px 0; font-size: 22px; font-weight: 600; color: {BRAND_ERROR}; text-align: center;">Task Failed</h1>
         <div style="background: rgba(239, 68, 68, 0.05); border: 1px solid rgba(239, 68, 68, 0.2); padding: 16px 20px; margin: 0 0 24px 0; border-radius: 8px;">
             <p style="margin: 0 0 6px 0; font-size: 11px; color: {BRAND_ERROR}; text-transform: uppercase;">Error Details</p>
-            <p style="margin: 0; font-size: 13px; color: {BRAND_MUTED}; font-family: monospace;">{error_message}</p>
+            <p style="margin: 0; font-size: 13px; color: {BRAND_MUTED}; font-family: monospace;">${{ERROR_MESSAGE}}</p>
         </div>
-    '''
+    ''')
+
+async def send_agent_email(user_id: str, subject: str, body_text: str) -> dict:
+    """Send general agent email."""
+    supabase = get_supabase()
+    # Sync client: run the query off the event loop
+    result = await asyncio.to_thread(
+        supabase.table("profiles").select("email").eq("id", user_id).single().execute
+    )
+
+    if not result.data or not result.data.get("email"):
+        raise ValueError(f"Could not find email for user {user_id}")
+    
+    user_email = result.data["email"]
+    body_html_content = body_text.replace('\n', '<br>')
+
+    content = _AGENT_BODY_TMPL.substitute(BODY=body_html_content)
+    html = _get_email_wrapper(content)
+
+    return await send_teammate_email(user_email, user_id, subject, html)
+
+async def send_approval_request(user_email: str, user_id: str, workflow_id: str, action: str) -> dict:
+    """Sends Human-in-the-Loop approval email."""
+    approve_url = f"{settings.BACKEND_URL}/webhooks/agentmail/approve?workflow_id={workflow_id}"
+    reject_url = f"{settings.BACKEND_URL}/webhooks/agentmail/reject?workflow_id={workflow_id}"
+
+    content = _APPROVAL_TMPL.substitute(
+        ACTION=action, APPROVE_URL=approve_url, REJECT_URL=reject_url
+    )
+    return await send_teammate_email(user_email, user_id, "⚠️ Action Requires Your Approval", _get_email_wrapper(content))
+
+async def send_task_started_email(user_email: str, user_id: str, goal: str, dashboard_url: Optional[str] = None, thread_id: str = None) -> dict:
+    dash_link = dashboard_url or f"{settings.FRONTEND_URL}/dashboard"
+    
+    # If replying to a thread, use a more conversational style
+    if thread_id:
+        content = _TASK_STARTED_REPLY_TMPL.substitute(DASH_LINK=dash_link)
+        subject = "Re: Your Request" # Subject is usually ignored in threading but good fallback
+    else:
+        # Standard notification for dashboard-initiated tasks
+        content = _TASK_STARTED_TMPL.substitute(GOAL=goal[:500], DASH_LINK=dash_link)
+        subject = "🚀 Working on your task"
+
+    return await send_teammate_email(user_email, user_id, subject, _get_email_wrapper(content), thread_id=thread_id)
+
+async def send_completion_email(user_email: str, user_id: str, goal: str, summary: str, actions_taken: Optional[list] = None) -> dict:
+    actions_html = ""
+    if actions_taken:
+        items = "".join([f'<li style="margin: 8px 0; color: {BRAND_TEXT}; font-size: 13px;">{a}</li>' for a in actions_taken[:5]])
+        actions_html = f'<div style="background: {BRAND_BG}; border: 1px solid {BRAND_BORDER}; padding: 16px 20px; margin: 0 0 24px 0; border-radius: 8px;"><ul style="margin: 0; padding-left: 20px;">{items}</ul></div>'
+
+    content = _COMPLETION_TMPL.substitute(SUMMARY=summary, ACTIONS_HTML=actions_html)
+    return await send_teammate_email(user_email, user_id, "✅ Task Completed", _get_email_wrapper(content))
+
+async def send_error_email(user_email: str, user_id: str, goal: str, error_type: str, error_message: str) -> dict:
+    content = _ERROR_TMPL.substitute(ERROR_MESSAGE=error_message)
     return await send_teammate_email(user_email, user_id, "❌ Task Failed", _get_email_wrapper(content))
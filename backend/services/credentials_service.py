@@ -13,6 +13,7 @@ This service handles:
 - Generating unique agent emails for each user
 - Capturing and persisting auth state across sessions
 """
+import asyncio
 import secrets
 import string
 from typing import Optional, Dict, Any
@@ -22,7 +23,6 @@ from backend.services.steel_service import steel_client
 
 settings = get_settings()
 
-# Agent email domain (must be verified in your email provider)
 # Agent email domain (must be verified in your email provider)
 AGENT_EMAIL_DOMAIN = "reluit.com"
 
@@ -39,12 +39,28 @@ def generate_agent_email(user_id: str, platform: str) -> str:
     return f"agent-{short_id}-{platform_slug}@{AGENT_EMAIL_DOMAIN}"
 
 
+# Password alphabet, precomputed once as bytes for generate_secure_password
+_PASSWORD_ALPHABET = (string.ascii_letters + string.digits + "!@#$%^&*").encode()
+# Bytes at or above this would bias the modulo mapping; reject them
+_PASSWORD_REJECT_AT = 256 - (256 % len(_PASSWORD_ALPHABET))
+
+
 def generate_secure_password(length: int = 24) -> str:
     """
     Generates a cryptographically secure password for agent accounts.
+
+    Draws random bytes in bulk instead of one secrets.choice() call per
+    character, rejecting bytes that would bias the modulo mapping so the
+    distribution stays uniform.
     """
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    chars = []
+    while len(chars) < length:
+        for b in secrets.token_bytes(length * 2):
+            if b < _PASSWORD_REJECT_AT:
+                chars.append(_PASSWORD_ALPHABET[b % len(_PASSWORD_ALPHABET)])
+                if len(chars) == length:
+                    break
+    return bytes(chars).decode()
 
 
 async def store_credential_in_steel(
@@ -83,7 +99,10 @@ async def store_credential_in_steel(
         credential_data["value"]["totpSecret"] = totp_secret
     
     try:
-        result = steel_client.credentials.create(**credential_data)
+        # Sync SDK call: run in a worker thread so it doesn't block the loop
+        result = await asyncio.to_thread(
+            lambda: steel_client.credentials.create(**credential_data)
+        )
         print(f"🔐 Stored credentials for {origin}")
         return {"id": result.id, "origin": origin, "status": "stored"}
     except Exception as e:
@@ -121,29 +140,44 @@ async def create_agent_account(
     agent_email = generate_agent_email(user_id, platform)
     agent_password = custom_password or generate_secure_password()
     
-    # Store in Steel for auto-injection
-    steel_result = await store_credential_in_steel(
+    # The Steel vault write and the Supabase row are independent except for
+    # the vault id, which Steel assigns. Run both concurrently, then patch
+    # the vault id onto the row once Steel answers — the tiny update is far
+    # cheaper than serializing the two round-trips.
+    steel_task = asyncio.create_task(store_credential_in_steel(
         origin=platform_url,
         username=agent_email,
         password=agent_password,
         namespace=f"user-{user_id[:8]}"
-    )
-    
+    ))
+
     # Store reference in Supabase (password NOT stored here, only in Steel)
     workspace_data = {
         "user_id": user_id,
         "platform_name": platform,
         "agent_email": agent_email,
-        "credentials_vault_id": steel_result.get("id"),
         "is_active": True
     }
-    
-    # Upsert to handle duplicates
-    result = supabase.table("workspaces").upsert(
-        workspace_data,
-        on_conflict="user_id,platform_name"
-    ).execute()
-    
+
+    # Upsert to handle duplicates; sync client, so run off the event loop
+    steel_result, _ = await asyncio.gather(
+        steel_task,
+        asyncio.to_thread(
+            supabase.table("workspaces").upsert(
+                workspace_data,
+                on_conflict="user_id,platform_name"
+            ).execute
+        ),
+    )
+
+    vault_id = steel_result.get("id")
+    if vault_id:
+        await asyncio.to_thread(
+            supabase.table("workspaces").update(
+                {"credentials_vault_id": vault_id}
+            ).eq("user_id", user_id).eq("platform_name", platform).execute
+        )
+
     return {
         "platform": platform,
         "agent_email": agent_email,
@@ -160,12 +194,15 @@ async def get_agent_credentials(user_id: str, platform: str) -> Optional[Dict[st
     injected automatically during browser sessions.
     """
     supabase = get_supabase()
-    
-    result = supabase.table("workspaces").select("*").eq(
-        "user_id", user_id
-    ).eq(
-        "platform_name", platform
-    ).single().execute()
+
+    # Sync client: run the query off the event loop
+    result = await asyncio.to_thread(
+        supabase.table("workspaces").select("*").eq(
+            "user_id", user_id
+        ).eq(
+            "platform_name", platform
+        ).single().execute
+    )
     
     if result.data:
         return {
@@ -188,7 +225,7 @@ async def capture_session_auth(session_id: str) -> Dict[str, Any]:
         Session context object that can be passed to new sessions
     """
     try:
-        context = steel_client.sessions.context(session_id)
+        context = await asyncio.to_thread(steel_client.sessions.context, session_id)
         print(f"📸 Captured auth context from session {session_id[:8]}...")
         return {
             "context": context,
@@ -228,7 +265,9 @@ async def create_authenticated_session(
         session_params["session_context"] = session_context
     
     try:
-        session = steel_client.sessions.create(**session_params)
+        session = await asyncio.to_thread(
+            lambda: steel_client.sessions.create(**session_params)
+        )
         print(f"🖥️ Created authenticated session: {session.id}")
         
         return {
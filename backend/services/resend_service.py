@@ -15,6 +15,8 @@ Email Strategy:
 - User identification: via email lookup in profiles table
 - No complex sub-addressing required!
 """
+import asyncio
+
 import resend
 from backend.core.config import get_settings
 from typing import Optional
@@ -186,10 +188,12 @@ async def send_agent_email(user_id: str, subject: str, body_text: str) -> dict:
     from backend.services.supabase_client import get_supabase
     
     supabase = get_supabase()
-    
-    # Look up user email from profiles
-    result = supabase.table("profiles").select("email").eq("id", user_id).single().execute()
-    
+
+    # Look up user email from profiles (sync client — run off the event loop)
+    result = await asyncio.to_thread(
+        supabase.table("profiles").select("email").eq("id", user_id).single().execute
+    )
+
     if not result.data or not result.data.get("email"):
         raise ValueError(f"Could not find email for user {user_id}")
     
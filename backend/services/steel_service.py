@@ -14,6 +14,7 @@ Key Features:
 
 API Reference: https://docs.steel.dev
 """
+import asyncio
 from steel import Steel
 from typing import Optional, Dict, Any, Tuple, List
 from backend.core.config import get_settings
@@ -47,7 +48,10 @@ async def start_teammate_browser(
     # Try to reconnect to existing session
     if existing_session_id:
         try:
-            context = steel_client.sessions.context(existing_session_id)
+            # Sync SDK: keep the event loop free during the round-trip
+            context = await asyncio.to_thread(
+                steel_client.sessions.context, existing_session_id
+            )
             if context:
                 print(f"♻️ Reconnected to Steel session: {existing_session_id}")
                 return {
@@ -74,7 +78,9 @@ async def start_teammate_browser(
         print("🔐 Starting session with pre-loaded auth context")
     
     # Create new session
-    session = steel_client.sessions.create(**session_params)
+    session = await asyncio.to_thread(
+        lambda: steel_client.sessions.create(**session_params)
+    )
     
     # Steel returns debugUrl which is the correct embed URL for live viewing
     debug_url = getattr(session, 'debug_url', None) or getattr(session, 'debugUrl', None)
@@ -128,7 +134,8 @@ def execute_action(
     delta_y: int = 0,
     duration: float = 1.0,
     num_clicks: int = 1,
-    path: Optional[List[List[int]]] = None
+    path: Optional[List[List[int]]] = None,
+    screenshot: bool = True
 ) -> Tuple[str, str]:
     """
     Execute a computer action on the Steel session.
@@ -147,7 +154,7 @@ def execute_action(
     """
     payload: Dict[str, Any] = {
         "action": action,
-        "screenshot": True
+        "screenshot": screenshot
     }
     
     # Add action-specific parameters
@@ -186,6 +193,30 @@ def execute_action(
     return screenshot, url
 
 
+def run_sequence(session_id: str, ops: List[Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Run several micro-ops back-to-back on one session.
+
+    Composite gestures (navigate = focus bar, type, enter, wait) previously
+    rendered and shipped a screenshot per micro-op even though only the end
+    state matters. Only the final op of a sequence captures a screenshot.
+
+    Each op is a dict with an "action" key plus that action's kwargs, e.g.
+    {"action": "press_key", "keys": ["Control", "l"]}.
+
+    Returns: (base64_screenshot, current_url) from the final op.
+    """
+    screenshot, url = "", "about:blank"
+    last = len(ops) - 1
+    for i, op in enumerate(ops):
+        kwargs = dict(op)
+        action = kwargs.pop("action")
+        screenshot, url = execute_action(
+            session_id, action, screenshot=(i == last), **kwargs
+        )
+    return screenshot, url
+
+
 # Convenience functions for common actions
 def get_cursor_position(session_id: str) -> Tuple[int, int]:
     """Get current cursor position (x, y)."""
@@ -236,7 +267,7 @@ def wait(session_id: str, seconds: float = 1.0) -> Tuple[str, str]:
 async def release_session(session_id: str):
     """Releases a Steel session when the task is complete."""
     try:
-        steel_client.sessions.release(session_id)
+        await asyncio.to_thread(steel_client.sessions.release, session_id)
         print(f"🔓 Released Steel session: {session_id}")
     except Exception as e:
         print(f"⚠️ Failed to release session: {e}")
@@ -1,8 +1,27 @@
+from functools import lru_cache
+
+import httpx
 from supabase import create_client, Client
 from backend.core.config import get_settings
 
 settings = get_settings()
 
+@lru_cache(maxsize=1)
 def get_supabase() -> Client:
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+    """
+    Build the Supabase client once per process.
 
+    Every handler calls get_supabase(); without memoization each call
+    constructs a fresh client (and a fresh httpx pool underneath), paying a
+    TLS handshake per query. The keep-alive limits let concurrent webhook
+    bursts reuse warm connections to PostgREST.
+    """
+    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+    old_session = client.postgrest.session
+    client.postgrest.session = httpx.Client(
+        base_url=old_session.base_url,
+        headers=old_session.headers,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=10.0,
+    )
+    return client
@@ -7,13 +7,22 @@ Activities handle: database ops, browser control, email sending, memory.
 Key pattern: Activities are synchronous Python functions that Temporal manages.
 If one fails, Temporal retries it without restarting the whole workflow.
 """
+from typing import Dict
+
 from temporalio import activity
 from backend.services.supabase_client import get_supabase
-from backend.services.agent_service import GhostTeammateAgent
+from backend.services.agent_service import GhostTeammateAgent, create_agent_with_credentials
 from backend.services import steel_service
 from backend.services.supermemory_service import get_user_context, add_memory
 from backend.services.agentmail_service import send_approval_request, send_error_email
 
+# One agent per Steel session, reused across execute_agent_turn calls in
+# this worker. The agent carries per-session state — conversation memory,
+# memoized prompts, the prefetched post-action screenshot — that is useless
+# if a fresh instance is built every turn. If the workflow lands on another
+# worker it simply starts a fresh agent from the current screenshot.
+_session_agents: Dict[str, GhostTeammateAgent] = {}
+
 
 @activity.defn
 async def create_job_record(user_id: str, goal: str) -> str:
@@ -112,16 +121,19 @@ async def execute_agent_turn(
     
     Returns: dict with 'reasoning', 'finished', 'action_taken', 'error_type' (if any)
     """
-    from backend.services.agent_service import create_agent_with_credentials
-    
     try:
-        # Initialize agent with credentials loaded
-        agent = await create_agent_with_credentials(
-            user_id=user_id,
-            user_profile=user_profile,
-            session_id=session_id
-        )
-        
+        # Reuse the session's agent so memory and the screenshot prefetch
+        # survive across turns; create it on the first turn only
+        agent = _session_agents.get(session_id)
+        if agent is None or agent.user_id != user_id:
+            agent = await create_agent_with_credentials(
+                user_id=user_id,
+                user_profile=user_profile,
+                session_id=session_id,
+                job_id=job_id
+            )
+            _session_agents[session_id] = agent
+
         # Execute one reasoning-action cycle
         result = await agent.execute_turn(goal)
         
@@ -346,4 +358,9 @@ async def release_browser_session(session_id: str) -> None:
     Releases the Steel browser session to free resources.
     Called after task completion or failure.
     """
+    # Drop the session's agent and stop any in-flight screenshot prefetch
+    # so nothing keeps polling Steel after the session is gone
+    agent = _session_agents.pop(session_id, None)
+    if agent is not None:
+        agent.cancel_pending_screenshot()
     await steel_service.release_session(session_id)
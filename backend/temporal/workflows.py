@@ -98,19 +98,25 @@ class GhostTeammateWorkflow:
         }
 
     @workflow.run
-    async def run(self, goal: str, user_id: str, user_email: str, thread_id: str = None) -> str:
+    async def run(self, goal, user_id: str, user_email: str, thread_id: str = None) -> str:
         """
         Main workflow execution.
-        
+
         Args:
-            goal: The user's task/request
+            goal: The user's task/request - either a plain string or a
+                {"subject": ..., "body": ...} dict from the email webhook
+                (joined here on the worker side rather than at the
+                webhook boundary)
             user_id: Unique user identifier
             user_email: Email to send updates to
             thread_id: Optional thread ID to reply to (if triggered by email)
-            
+
         Returns:
             Final status message
         """
+        if isinstance(goal, dict):
+            goal = f"Subject: {goal.get('subject', 'No Subject')}\n\n{goal.get('body', '')}"
+
         session_id = None  # Track for cleanup
         
         try:
@@ -0,0 +1,18 @@
+-- =============================================
+-- Case-insensitive user lookup for inbound webhooks
+-- =============================================
+-- The webhook previously issued an exact-match query followed by a
+-- full-table fallback. This function resolves a sender in a single
+-- round-trip, backed by a functional index on lower(email_address).
+
+CREATE INDEX IF NOT EXISTS idx_profiles_email_lower
+  ON profiles (lower(email_address));
+
+CREATE OR REPLACE FUNCTION find_user_by_email_ci(email TEXT)
+RETURNS TABLE (id UUID, full_name TEXT)
+LANGUAGE sql STABLE AS $$
+  SELECT p.id, p.full_name
+  FROM profiles p
+  WHERE lower(p.email_address) = lower(find_user_by_email_ci.email)
+  LIMIT 1;
+$$;
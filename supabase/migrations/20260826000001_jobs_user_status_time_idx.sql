@@ -0,0 +1,12 @@
+-- Compound index for "latest active job for a user" lookups.
+--
+-- Queries of the shape
+--   SELECT ... FROM jobs
+--   WHERE user_id = $1 AND status IN ('running', 'waiting_approval', 'waiting_info')
+--   ORDER BY created_at DESC LIMIT 1
+-- can only use one of the single-column jobs indexes, then sort the
+-- matching rows. With (user_id, status, created_at DESC) the planner does a
+-- single index range scan and stops at the first row, so LIMIT 1 is O(log n).
+
+CREATE INDEX IF NOT EXISTS idx_jobs_user_status_time
+    ON jobs (user_id, status, created_at DESC);